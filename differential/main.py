@@ -14,6 +14,8 @@ from PySide6.QtCore import Qt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+from polyfit import PolyFitter
+
 
 # ---------- математика МКР ----------
 
@@ -149,10 +151,9 @@ def build_approx(xs, ys, degree=None):
     if degree is None:
         degree = min(5, len(xs) - 1)
 
-    X = np.vander(xs, degree + 1, increasing=True)
-    XtX = X.T @ X
-    XtY = X.T @ ys
-    coeffs = np.linalg.solve(XtX, XtY)
+    # QR вместо нормальных уравнений X^T X p = X^T y (они возводят
+    # обусловленность в квадрат) — см. polyfit.PolyFitter
+    coeffs, _ = PolyFitter(xs, degree).fit(ys)
     return coeffs
 
 
@@ -1,6 +1,27 @@
+from math import comb
+from typing import Sequence, Tuple
+
 import numpy as np
 
 
+def _bjorck_pereyra(xs, ys):
+    """
+    Решение системы Вандермонда X a = y за O(n²) и O(n) памяти
+    (алгоритм Бьорка–Перейры): разделённые разности, затем перевод
+    формы Ньютона в мономы.
+    """
+    a = ys.copy()
+    n = len(xs) - 1
+
+    for k in range(n):
+        a[k + 1:] = (a[k + 1:] - a[k:n]) / (xs[k + 1:] - xs[:n - k])
+
+    for k in range(n - 1, -1, -1):
+        a[k:n] -= xs[k] * a[k + 1:]
+
+    return a
+
+
 def canonical_poly_coeffs(xs, ys):
     """
     Находит коэффициенты канонического интерполяционного полинома
@@ -18,14 +39,12 @@ def canonical_poly_coeffs(xs, ys):
     if xs.shape != ys.shape:
         raise ValueError("xs и ys должны иметь одинаковую длину")
 
-    n = len(xs)
-
-    # Вандермондова матрица: столбцы [1, x, x^2, ..., x^{n-1}]
-    # increasing=True -> степени растут слева направо
-    X = np.vander(xs, N=n, increasing=True)
+    if len(np.unique(xs)) != len(xs):
+        raise ValueError("узлы xs должны быть различными")
 
-    # Решаем систему X * a = y
-    coeffs = np.linalg.solve(X, ys)
+    # Решаем систему X * a = y с вандермондовой матрицей
+    # X = [1, x, x^2, ..., x^{n-1}], не строя саму матрицу
+    coeffs = _bjorck_pereyra(xs, ys)
     return coeffs
 
 
@@ -90,6 +109,79 @@ def polyfit_canonical(xs, ys):
     return coeffs, formula
 
 
+class PolyFitter:
+    """
+    МНК-полином степени k через QR-разложение матрицы Вандермонда.
+
+    Нормальные уравнения X^T X p = X^T y возводят обусловленность X в
+    квадрат. Здесь X = QR, и p находится из R p = Q^T y — обусловленность
+    та же, что у X. Чтобы и она была умеренной, x предварительно
+    переводится на [-1, 1]: t = (x - center) / scale.
+
+    Разложение делается один раз на набор x; fit() принимает сразу
+    матрицу Y (n, m) — m рядов с общими x решаются одной правой частью.
+    """
+
+    def __init__(self, x_vals: Sequence[float], degree: int) -> None:
+        x = np.asarray(x_vals, dtype=float)
+        if x.ndim != 1:
+            raise ValueError("x_vals должен быть одномерным")
+        if degree < 0:
+            raise ValueError("Степень полинома должна быть неотрицательной")
+        if len(x) < degree + 1:
+            raise np.linalg.LinAlgError(
+                f"Для степени {degree} нужно минимум {degree + 1} точек")
+
+        self.degree = degree
+        self.center = 0.5 * (x.min() + x.max())
+        self.scale = 0.5 * (x.max() - x.min()) or 1.0
+
+        self.V = np.vander((x - self.center) / self.scale, degree + 1, increasing=True)
+        self.Q, self.R = np.linalg.qr(self.V)
+
+        d = np.abs(np.diag(self.R))
+        if d.min() <= 1e-12 * d.max():
+            raise np.linalg.LinAlgError("Матрица МНК вырождена (мало различных x)")
+
+    def _to_monomial(self, c: np.ndarray) -> np.ndarray:
+        """Коэффициенты по степеням t -> по степеням x."""
+        k = self.degree
+        T = np.zeros((k + 1, k + 1))
+        for j in range(k + 1):
+            for i in range(j + 1):
+                # ((x - center)/scale)^j = Σ C(j, i) x^i (-center)^(j-i) / scale^j
+                T[i, j] = comb(j, i) * (-self.center) ** (j - i) / self.scale ** j
+        return T @ c
+
+    def fit(self, y_vals) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :param y_vals: значения y_i, вектор (n,) или матрица (n, m)
+        :return: (coeffs, S), coeffs — по возрастанию степеней x, формы
+                 (k+1,) или (k+1, m); S — сумма квадратов отклонений
+                 (число или вектор (m,))
+        """
+        Y = np.asarray(y_vals, dtype=float)
+        if Y.shape[0] != self.V.shape[0]:
+            raise ValueError("x_vals и y_vals должны иметь одинаковую длину")
+
+        c = np.linalg.solve(self.R, self.Q.T @ Y)
+        residuals = self.V @ c - Y
+        S = np.sum(residuals ** 2, axis=0)
+        return self._to_monomial(c), S
+
+
+def polyfit_qr(
+    x_vals: Sequence[float],
+    y_vals,
+    degree: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    МНК-полином степени degree: (coeffs по возрастанию степеней, S).
+    y_vals может быть матрицей (n, m) — тогда m рядов решаются разом.
+    """
+    return PolyFitter(x_vals, degree).fit(y_vals)
+
+
 if __name__ == "__main__":
     # маленький пример теста:
     xs_example = [ -1.0, 0.0, 1.0 ]
@@ -0,0 +1,137 @@
+"""
+Ускорение простого итерационного метода x = φ(x).
+
+При φ(x) = x − f(x)/m простая итерация сходится лишь линейно.
+Здесь собраны способы ускорить её, используя ту же φ и без производных:
+    * "steffensen" — метод Стеффенсена: Δ²-процесс Эйткена с перезапуском
+      на каждом шаге, сходимость квадратичная;
+    * "aitken"     — Δ²-процесс Эйткена над обычной последовательностью
+      итераций (без перезапуска);
+    * "anderson"   — смешивание Андерсона по m последним итерациям.
+"""
+
+import numpy as np
+
+
+def _steffensen(phi, x0, eps, max_iter, trace):
+    x = x0
+    n = 0
+    while True:
+        x1 = phi(x)
+        x2 = phi(x1)
+        d2 = x2 - 2 * x1 + x
+        n += 1
+
+        if d2 == 0:
+            # вторая разность обнулилась — итерации уже стоят на месте
+            xn = x2
+        else:
+            xn = x - (x1 - x) ** 2 / d2
+
+        dx = abs(xn - x)
+        if trace is not None:
+            trace.record(xn, dx)
+
+        if dx <= eps:
+            return xn, n
+
+        if n > max_iter:
+            raise RuntimeError("Метод Стеффенсена: превышено число итераций")
+
+        x = xn
+
+
+def _aitken(phi, x0, eps, max_iter, trace):
+    x0_, x1 = x0, phi(x0)
+    prev = None
+    n = 0
+    while True:
+        x2 = phi(x1)
+        d2 = x2 - 2 * x1 + x0_
+        n += 1
+
+        xa = x2 if d2 == 0 else x0_ - (x1 - x0_) ** 2 / d2
+        dx = abs(xa - prev) if prev is not None else abs(x2 - x1)
+        if trace is not None:
+            trace.record(xa, dx)
+
+        if dx <= eps:
+            return xa, n
+
+        if n > max_iter:
+            raise RuntimeError("Процесс Эйткена: превышено число итераций")
+
+        prev = xa
+        x0_, x1 = x1, x2
+
+
+def _anderson(phi, x0, eps, m, max_iter, trace):
+    scalar = np.ndim(x0) == 0
+    x = np.atleast_1d(np.asarray(x0, dtype=float))
+
+    g = np.atleast_1d(np.asarray(phi(x[0] if scalar else x), dtype=float))
+    r = g - x                       # невязка итерации φ(x) − x
+    dG, dR = [], []                 # разности последних m значений φ и невязок
+    n = 0
+
+    while True:
+        if dR:
+            R = np.column_stack(dR)
+            gamma = np.linalg.lstsq(R, r, rcond=None)[0]
+            xn = g - np.column_stack(dG) @ gamma
+        else:
+            xn = g
+
+        gn = np.atleast_1d(np.asarray(phi(xn[0] if scalar else xn), dtype=float))
+        rn = gn - xn
+        n += 1
+
+        dx = float(np.max(np.abs(xn - x)))
+        if trace is not None:
+            trace.record(xn[0] if scalar else xn, dx)
+
+        if dx <= eps:
+            return (float(xn[0]) if scalar else xn), n
+
+        if n > max_iter:
+            raise RuntimeError("Смешивание Андерсона: превышено число итераций")
+
+        dG.append(gn - g)
+        dR.append(rn - r)
+        if len(dR) > m:
+            dG.pop(0)
+            dR.pop(0)
+        x, g, r = xn, gn, rn
+
+
+def accelerated_iteration(phi, x0, eps, method="steffensen", m=3, max_iter=50, trace=None):
+    """
+    Ускоренный итерационный метод для x = φ(x).
+
+    :param phi: функция φ(x) (та же, что и для простой итерации)
+    :param x0: начальное приближение (для Андерсона допустим вектор)
+    :param eps: точность по |x_{k+1} − x_k|
+    :param method: "steffensen", "aitken" или "anderson"
+    :param m: глубина памяти для смешивания Андерсона
+    :param trace: необязательный журнал итераций (tracing.SolverTrace)
+    :return: (корень, число итераций)
+    """
+    if method == "steffensen":
+        return _steffensen(phi, x0, eps, max_iter, trace)
+    if method == "aitken":
+        return _aitken(phi, x0, eps, max_iter, trace)
+    if method == "anderson":
+        return _anderson(phi, x0, eps, m, max_iter, trace)
+    raise ValueError(f"Неизвестный метод ускорения: {method}")
+
+
+def evaluations_saved(nf_plain, nf_fast):
+    """
+    Сколько вычислений φ сэкономлено по сравнению с простой итерацией.
+
+    Сравниваются вызовы φ, а не итерации: шаг Стеффенсена и Эйткена
+    стоит двух вызовов φ, и разница в итерациях завышала бы выигрыш.
+    :param nf_plain: вызовов φ у уже выполненной простой итерации
+    :param nf_fast: вызовов φ у ускоренного метода
+    """
+    return nf_plain - nf_fast
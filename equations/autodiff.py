@@ -0,0 +1,131 @@
+"""
+Автоматическое дифференцирование вперёд до второго порядка.
+
+Jet(v, d1, d2) хранит значение функции и две её производные в точке.
+Если передать в f объект Jet(x, 1, 0), арифметика сама вычислит
+f(x), f'(x) и f''(x) за один проход — без ручных формул производных
+и без погрешности конечных разностей.
+
+Функции должны быть записаны через +, −, *, /, ** и np.exp / np.log /
+np.sqrt / np.sin / np.cos (numpy вызывает одноимённые методы Jet).
+"""
+
+import math
+from typing import Callable, Tuple
+
+
+class Jet:
+    """Значение и первые две производные: (v, v', v'')."""
+
+    __slots__ = ("v", "d1", "d2")
+
+    def __init__(self, v: float, d1: float = 0.0, d2: float = 0.0):
+        self.v = float(v)
+        self.d1 = float(d1)
+        self.d2 = float(d2)
+
+    @staticmethod
+    def _wrap(other) -> "Jet":
+        return other if isinstance(other, Jet) else Jet(other)
+
+    def _chain(self, g0: float, g1: float, g2: float) -> "Jet":
+        """g(self) по известным g, g', g'' во внешней точке."""
+        return Jet(g0, g1 * self.d1, g2 * self.d1 ** 2 + g1 * self.d2)
+
+    def __repr__(self):
+        return f"Jet({self.v!r}, {self.d1!r}, {self.d2!r})"
+
+    # ---------- арифметика ----------
+
+    def __neg__(self):
+        return Jet(-self.v, -self.d1, -self.d2)
+
+    def __pos__(self):
+        return self
+
+    def __add__(self, other):
+        o = self._wrap(other)
+        return Jet(self.v + o.v, self.d1 + o.d1, self.d2 + o.d2)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        o = self._wrap(other)
+        return Jet(self.v - o.v, self.d1 - o.d1, self.d2 - o.d2)
+
+    def __rsub__(self, other):
+        return self._wrap(other) - self
+
+    def __mul__(self, other):
+        o = self._wrap(other)
+        return Jet(
+            self.v * o.v,
+            self.d1 * o.v + self.v * o.d1,
+            self.d2 * o.v + 2 * self.d1 * o.d1 + self.v * o.d2,
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        o = self._wrap(other)
+        inv = o._chain(1 / o.v, -1 / o.v ** 2, 2 / o.v ** 3)
+        return self * inv
+
+    def __rtruediv__(self, other):
+        return self._wrap(other) / self
+
+    def __pow__(self, k):
+        if isinstance(k, Jet):
+            return (self.log() * k).exp()
+        if k == 0:
+            return Jet(1.0)
+        v = self.v
+        return self._chain(v ** k, k * v ** (k - 1), k * (k - 1) * v ** (k - 2) if k != 1 else 0.0)
+
+    def __rpow__(self, base):
+        return (self * math.log(base)).exp()
+
+    # ---------- элементарные функции (для np.exp и т. п.) ----------
+
+    def exp(self):
+        e = math.exp(self.v)
+        return self._chain(e, e, e)
+
+    def log(self):
+        return self._chain(math.log(self.v), 1 / self.v, -1 / self.v ** 2)
+
+    def sqrt(self):
+        r = math.sqrt(self.v)
+        return self._chain(r, 0.5 / r, -0.25 / (r * self.v))
+
+    def sin(self):
+        s, c = math.sin(self.v), math.cos(self.v)
+        return self._chain(s, c, -s)
+
+    def cos(self):
+        s, c = math.sin(self.v), math.cos(self.v)
+        return self._chain(c, -s, -c)
+
+
+def _as_jet(v) -> Jet:
+    # np.exp(Jet) может вернуть 0-мерный object-массив
+    if not isinstance(v, Jet) and hasattr(v, "item"):
+        v = v.item()
+    return Jet._wrap(v)
+
+
+def jet(f: Callable, x: float) -> Tuple[float, float, float]:
+    """(f(x), f'(x), f''(x)) за один вызов f."""
+    r = _as_jet(f(Jet(x, 1.0, 0.0)))
+    return r.v, r.d1, r.d2
+
+
+def derivatives(f: Callable) -> Tuple[Callable, Callable]:
+    """Функции f'(x) и f''(x), построенные автоматическим дифференцированием."""
+    def fp(x):
+        return jet(f, x)[1]
+
+    def fpp(x):
+        return jet(f, x)[2]
+
+    return fp, fpp
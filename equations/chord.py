@@ -1,7 +1,8 @@
-def chord(f, a, b, eps, max_iter=50):
+def chord(f, a, b, eps, max_iter=50, trace=None):
     """
     Метод хорд (секущих).
     Возвращает найденный корень и число итераций.
+    trace — необязательный журнал итераций (tracing.SolverTrace).
     """
     # Проверка: на интервале должен быть корень
     if f(a) * f(b) >= 0:
@@ -14,6 +15,8 @@ def chord(f, a, b, eps, max_iter=50):
         # формула хорд
         bn = b - f(b) * (a - b) / (f(a) - f(b))
         n += 1
+        if trace is not None:
+            trace.record(bn, bn - bn_prev)
 
         if abs(bn - bn_prev) <= eps:
             return bn, n
@@ -1,7 +1,8 @@
-def combined_method(f, fp, a, b, eps, max_iter=50):
+def combined_method(f, fp, a, b, eps, max_iter=50, trace=None):
     """
     Комбинированный метод: слева Ньютона, справа хорды.
     Возвращает приближённый корень и число итераций.
+    trace — необязательный журнал итераций (tracing.SolverTrace).
     """
     if f(a) * f(b) >= 0:
         raise ValueError("Интервал [a, b] выбран неверно: нет смены знака функции.")
@@ -20,6 +21,8 @@ def combined_method(f, fp, a, b, eps, max_iter=50):
 
         d = abs(bn - an)
         n += 1
+        if trace is not None:
+            trace.record((an + bn) / 2.0, d)
 
         if d <= eps:
             # усредняем границы как итоговое приближение
@@ -0,0 +1,183 @@
+"""
+Продолжение корня по параметру: F(x, p) = 0 при p от p0 до p_end.
+
+Вместо того чтобы для каждого значения параметра заново отделять корень
+и решать уравнение с нуля, корень ведётся вдоль кривой решений:
+    предиктор  — шаг по касательной (из dx/dp = −F_p / F_x) от прошлого корня;
+    корректор  — один-два шага Ньютона перпендикулярно касательной
+                 (псевдодлина дуги);
+    шаг h      — растёт, если корректор сошёлся сразу, и дробится при неудаче.
+Параметризация по длине дуги проходит и точки поворота (folds), где
+dx/dp = ∞ и два корня сливаются и исчезают: в такой точке у касательной
+меняет знак p-компонента, и точка поворота записывается в ответ.
+"""
+
+import math
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+
+def _fd_partials(F, x, p, d=1e-7):
+    """F_x и F_p центральными разностями."""
+    dx = d * max(1.0, abs(x))
+    dp = d * max(1.0, abs(p))
+    Fx = (F(x + dx, p) - F(x - dx, p)) / (2 * dx)
+    Fp = (F(x, p + dp) - F(x, p - dp)) / (2 * dp)
+    return Fx, Fp
+
+
+def _tangent(Fx, Fp, prev=None, direction=1.0):
+    """Единичная касательная (dx, dp) к кривой F(x, p) = 0."""
+    tx, tp = -Fp, Fx
+    norm = math.hypot(tx, tp)
+    if norm == 0:
+        raise ZeroDivisionError("Продолжение: особая точка (F_x = F_p = 0)")
+    tx, tp = tx / norm, tp / norm
+
+    # ориентация: вдоль прошлой касательной, а в начале — в сторону p_end
+    ref = tx * prev[0] + tp * prev[1] if prev is not None else tp * direction
+    if ref < 0:
+        tx, tp = -tx, -tp
+    return tx, tp
+
+
+def _newton_fixed_p(F, partials, x, p, eps, where):
+    """Корень F(·, p) = 0 методом Ньютона при фиксированном p."""
+    for _ in range(50):
+        Fv = F(x, p)
+        if Fv == 0:
+            return x
+        Fx, _ = partials(x, p)
+        if Fx == 0:
+            raise RuntimeError(f"Продолжение: {where} — F_x = 0, шаг Ньютона невозможен")
+        dx = Fv / Fx
+        x -= dx
+        if abs(dx) <= eps:
+            return x
+    raise RuntimeError(f"Продолжение: {where} — метод Ньютона не сошёлся")
+
+
+def _refine_fold(F, partials, x, p, eps, d=1e-6):
+    """
+    Уточнение точки поворота методом Ньютона для системы F = 0, F_x = 0
+    (вторые производные — разностями от partials).
+    """
+    for _ in range(20):
+        Fx, Fp = partials(x, p)
+        hx = d * max(1.0, abs(x))
+        hp = d * max(1.0, abs(p))
+        Fxx = (partials(x + hx, p)[0] - partials(x - hx, p)[0]) / (2 * hx)
+        Fxp = (partials(x, p + hp)[0] - partials(x, p - hp)[0]) / (2 * hp)
+        Fv = F(x, p)
+        det = Fx * Fxp - Fp * Fxx
+        if det == 0:
+            return None
+        dx = (Fv * Fxp - Fp * Fx) / det
+        dp = (Fx * Fx - Fxx * Fv) / det
+        x -= dx
+        p -= dp
+        if max(abs(dx), abs(dp)) <= math.sqrt(eps):
+            return p, x
+    return None
+
+
+def track_root(
+    F: Callable[[float, float], float],
+    x0: float,
+    p0: float,
+    p_end: float,
+    h: float = 0.05,
+    partials: Optional[Callable[[float, float], Tuple[float, float]]] = None,
+    eps: float = 1e-10,
+    h_min: float = 1e-8,
+    h_max: float = 0.5,
+    max_corr: int = 3,
+    max_steps: int = 10000,
+):
+    """
+    Ведёт корень уравнения F(x, p) = 0 от p0 до p_end.
+
+    :param F: функция F(x, p)
+    :param x0: приближение к корню при p = p0 (уточняется методом Ньютона)
+    :param partials: функция (x, p) -> (F_x, F_p); если None — разности
+    :param eps: точность корректора (шаг Ньютона s принимается, когда s² <= eps:
+                оставшаяся ошибка квадратична по s)
+    :param h, h_min, h_max: начальный, минимальный и максимальный шаг по дуге
+    :param max_corr: сколько шагов Ньютона разрешено корректору; если хватило
+                     одного-двух, шаг по дуге увеличивается
+    :return: (ps, xs, folds) — точки пути и список точек поворота (p, x)
+    """
+    if partials is None:
+        partials = lambda x, p: _fd_partials(F, x, p)
+
+    direction = 1.0 if p_end >= p0 else -1.0
+    p_lo, p_hi = min(p0, p_end), max(p0, p_end)
+
+    # уточняем стартовый корень при фиксированном p
+    p = float(p0)
+    x = _newton_fixed_p(F, partials, float(x0), p, eps, "стартовый корень")
+
+    ps: List[float] = [p]
+    xs: List[float] = [x]
+    folds: List[Tuple[float, float]] = []
+    t = _tangent(*partials(x, p), direction=direction)
+
+    for _ in range(max_steps):
+        # --- предиктор ---
+        xp, pp = x + h * t[0], p + h * t[1]
+
+        # --- корректор: F = 0 и (z − z_pred) ⊥ t ---
+        xc, pc = xp, pp
+        converged = False
+        n_corr = 0
+        for n_corr in range(1, max_corr + 1):
+            Fv = F(xc, pc)
+            Fx, Fp = partials(xc, pc)
+            g = t[0] * (xc - xp) + t[1] * (pc - pp)
+            det = Fx * t[1] - Fp * t[0]
+            if det == 0:
+                break
+            dx = (Fv * t[1] - Fp * g) / det
+            dp = (Fx * g - Fv * t[0]) / det
+            xc -= dx
+            pc -= dp
+            if max(abs(dx), abs(dp)) ** 2 <= eps or F(xc, pc) == 0:
+                converged = True
+                break
+
+        if not converged:
+            h /= 2
+            if h < h_min:
+                raise RuntimeError("Продолжение: шаг стал меньше допустимого")
+            continue
+
+        t_new = _tangent(*partials(xc, pc), prev=t)
+
+        # смена знака dp/ds — точка поворота между старой и новой точкой
+        if t[1] * t_new[1] < 0:
+            w = t[1] / (t[1] - t_new[1])
+            guess_p, guess_x = p + w * (pc - p), x + w * (xc - x)
+            fold = _refine_fold(F, partials, guess_x, guess_p, eps)
+            folds.append(fold if fold is not None else (guess_p, guess_x))
+
+        # вышли за p_end — последний корень ищем ровно при p = p_end
+        if not (p_lo <= pc <= p_hi):
+            p_stop = p_hi if pc > p_hi else p_lo
+            x_stop = x + (xc - x) * (p_stop - p) / (pc - p) if pc != p else xc
+            x_stop = _newton_fixed_p(F, partials, x_stop, p_stop, eps, "корень при p = p_end")
+            ps.append(p_stop)
+            xs.append(x_stop)
+            break
+
+        x, p, t = xc, pc, t_new
+        ps.append(p)
+        xs.append(x)
+
+        # быстрая сходимость корректора — шаг можно увеличить
+        if n_corr <= 2:
+            h = min(h * 1.5, h_max)
+    else:
+        raise RuntimeError("Продолжение: превышено число шагов")
+
+    return np.array(ps), np.array(xs), folds
@@ -1,13 +1,16 @@
-def dichotomy(f, a, b, eps):
+def dichotomy(f, a, b, eps, trace=None):
     """
     Метод дихотомии (бисекции).
     Возвращает найденный корень и количество итераций.
+    trace — необязательный журнал итераций (tracing.SolverTrace).
     """
     n = 0
 
     while True:
         c = (a + b) / 2
         fc = f(c)
+        if trace is not None:
+            trace.record(c, (b - a) / 2)
 
         if abs(fc) < eps:     # критерий остановки
             return c, n + 1
@@ -0,0 +1,72 @@
+"""
+Методы третьего порядка: Галлея и Чебышёва.
+
+Оба используют f, f' и f'' и сходятся кубически, поэтому при малом ε
+требуют меньше итераций, чем метод Ньютона.
+Если fp и fpp не заданы, производные берутся автоматическим
+дифференцированием (autodiff.jet): f вызывается один раз на итерацию.
+"""
+
+from autodiff import jet
+
+
+def _values(f, fp, fpp, x):
+    if fp is None or fpp is None:
+        return jet(f, x)
+    return f(x), fp(x), fpp(x)
+
+
+def _third_order(step, name, f, fp, fpp, x0, eps, max_iter, trace):
+    x = x0
+    n = 0
+    while True:
+        fx, d1, d2 = _values(f, fp, fpp, x)
+        if fx == 0:
+            return x, n
+        if d1 == 0:
+            raise ZeroDivisionError(f"{name}: производная равна 0")
+
+        x_new = x - step(fx, d1, d2)
+        n += 1
+        if trace is not None:
+            trace.record(x_new, x_new - x)
+
+        if abs(x_new - x) <= eps:
+            return x_new, n
+
+        if n > max_iter:
+            raise RuntimeError(f"{name}: превышено число итераций")
+
+        x = x_new
+
+
+def _halley_step(fx, d1, d2):
+    den = 2 * d1 * d1 - fx * d2
+    if den == 0:
+        return fx / d1              # вырожденный случай — шаг Ньютона
+    return 2 * fx * d1 / den
+
+
+def _chebyshev_step(fx, d1, d2):
+    u = fx / d1
+    return u * (1 + u * d2 / (2 * d1))
+
+
+def halley(f, fp, fpp, x0, eps, max_iter=50, trace=None):
+    """
+    Метод Галлея: x_{k+1} = x_k − 2 f f' / (2 f'² − f f'').
+    Возвращает найденный корень и число итераций.
+    fp, fpp — производные; None — автоматическое дифференцирование.
+    """
+    return _third_order(_halley_step, "Метод Галлея",
+                        f, fp, fpp, x0, eps, max_iter, trace)
+
+
+def chebyshev(f, fp, fpp, x0, eps, max_iter=50, trace=None):
+    """
+    Метод Чебышёва: x_{k+1} = x_k − (f/f') · (1 + f f'' / (2 f'²)).
+    Возвращает найденный корень и число итераций.
+    fp, fpp — производные; None — автоматическое дифференцирование.
+    """
+    return _third_order(_chebyshev_step, "Метод Чебышёва",
+                        f, fp, fpp, x0, eps, max_iter, trace)
@@ -0,0 +1,194 @@
+"""
+Отделение корней интервальной арифметикой (метод ветвей и отсечений).
+
+Вместо перебора отрезков с фиксированным шагом f, f' и f'' вычисляются
+сразу на целом отрезке X как интервалы, гарантированно содержащие все их
+значения на X:
+    * 0 ∉ f(X)   — корней на X нет, отрезок отбрасывается целиком;
+    * 0 ∉ f'(X)  — f монотонна, корень не больше одного: он есть,
+                   если f(a) и f(b) разного знака;
+    * иначе отрезок делится пополам.
+Так находятся все корни на [a, b], в том числе близко расположенные,
+а пустые области отбрасываются за одно вычисление.
+
+Функции должны быть записаны через арифметику (+, −, *, /, ** с целым
+показателем) и np.exp — тогда они принимают Interval без изменений.
+"""
+
+import math
+from typing import Callable, List, Optional, Tuple
+
+
+def _down(x: float) -> float:
+    return math.nextafter(x, -math.inf)
+
+
+def _up(x: float) -> float:
+    return math.nextafter(x, math.inf)
+
+
+class Interval:
+    """Отрезок [lo, hi] с направленным наружу округлением границ."""
+
+    __slots__ = ("lo", "hi")
+
+    def __init__(self, lo: float, hi: Optional[float] = None):
+        self.lo = float(lo)
+        self.hi = float(lo if hi is None else hi)
+
+    @staticmethod
+    def _wrap(v) -> "Interval":
+        return v if isinstance(v, Interval) else Interval(v, v)
+
+    @staticmethod
+    def _outward(lo: float, hi: float) -> "Interval":
+        return Interval(_down(lo), _up(hi))
+
+    def contains(self, v: float) -> bool:
+        return self.lo <= v <= self.hi
+
+    @property
+    def width(self) -> float:
+        return self.hi - self.lo
+
+    def __repr__(self):
+        return f"Interval({self.lo!r}, {self.hi!r})"
+
+    # ---------- арифметика ----------
+
+    def __neg__(self):
+        return Interval(-self.hi, -self.lo)
+
+    def __pos__(self):
+        return self
+
+    def __add__(self, other):
+        o = self._wrap(other)
+        return self._outward(self.lo + o.lo, self.hi + o.hi)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        o = self._wrap(other)
+        return self._outward(self.lo - o.hi, self.hi - o.lo)
+
+    def __rsub__(self, other):
+        return self._wrap(other) - self
+
+    def __mul__(self, other):
+        o = self._wrap(other)
+        p = (self.lo * o.lo, self.lo * o.hi, self.hi * o.lo, self.hi * o.hi)
+        return self._outward(min(p), max(p))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        o = self._wrap(other)
+        if o.contains(0.0):
+            return Interval(-math.inf, math.inf)
+        return self * Interval(_down(1.0 / o.hi), _up(1.0 / o.lo))
+
+    def __rtruediv__(self, other):
+        return self._wrap(other) / self
+
+    def __pow__(self, k):
+        if not isinstance(k, int) or k < 0:
+            raise TypeError("Interval: поддерживаются только целые степени k >= 0")
+        if k == 0:
+            return Interval(1.0)
+        lo_k, hi_k = self.lo ** k, self.hi ** k
+        if k % 2 == 1:
+            return self._outward(lo_k, hi_k)
+        if self.contains(0.0):
+            return Interval(0.0, _up(max(lo_k, hi_k)))
+        return self._outward(min(lo_k, hi_k), max(lo_k, hi_k))
+
+    def exp(self):
+        """Вызывается из np.exp(Interval)."""
+        return Interval(_down(math.exp(self.lo)), _up(math.exp(self.hi)))
+
+
+def _as_interval(v) -> Interval:
+    # np.exp(Interval) может вернуть 0-мерный object-массив
+    if not isinstance(v, Interval) and hasattr(v, "item"):
+        v = v.item()
+    return Interval._wrap(v)
+
+
+def isolate_roots(
+    f: Callable,
+    fp: Callable,
+    fpp: Optional[Callable] = None,
+    a: float = -10.0,
+    b: float = 490.0,
+    tol: float = 1e-6,
+    max_boxes: int = 100000,
+) -> List[Tuple[float, float]]:
+    """
+    Все отрезки [a_i, b_i] ⊂ [a, b], содержащие ровно по одному корню f.
+
+    На найденных отрезках f(a_i)·f(b_i) < 0 и f' не меняет знак; если задана
+    fpp, отрезки дополнительно дробятся, пока не сохраняет знак и f''
+    (условия сходимости методов хорд, Ньютона и комбинированного).
+    Отрезки шириной меньше tol, на которых отделить корень не удалось
+    (например, кратный корень), тоже попадают в ответ.
+    Точные нули возвращаются вырожденными отрезками (x, x).
+    """
+    roots = []
+    unresolved = []
+    for x in (a, b):
+        if f(x) == 0:
+            roots.append((x, x))
+
+    stack = [(a, b)]
+    boxes = 0
+
+    while stack:
+        lo, hi = stack.pop()
+        boxes += 1
+        if boxes > max_boxes:
+            raise RuntimeError("Отделение корней: превышено число подотрезков")
+
+        X = Interval(lo, hi)
+        if not _as_interval(f(X)).contains(0.0):
+            continue
+
+        small = hi - lo < tol
+        if not _as_interval(fp(X)).contains(0.0):
+            if f(lo) * f(hi) >= 0:
+                # монотонна без смены знака (нули на концах уже учтены)
+                continue
+            if fpp is None or small or not _as_interval(fpp(X)).contains(0.0):
+                roots.append((lo, hi))
+                continue
+
+        if small:
+            unresolved.append((lo, hi))
+            continue
+
+        mid = 0.5 * (lo + hi)
+        if f(mid) == 0:
+            roots.append((mid, mid))
+        stack.append((mid, hi))
+        stack.append((lo, mid))     # левая половина обрабатывается первой
+
+    # соседние неразрешённые кусочки (окрестность кратного корня) склеиваем
+    merged = []
+    for lo, hi in sorted(unresolved):
+        if merged and merged[-1][1] >= lo:
+            merged[-1] = (merged[-1][0], hi)
+        else:
+            merged.append((lo, hi))
+
+    # точный ноль в середине отрезка попадает и в (mid, mid), и в окружающий
+    # неразрешённый кусочек — перекрывающиеся отрезки объединяем; отрезки,
+    # лишь касающиеся друг друга концом, остаются раздельными (в каждом свой корень)
+    result = []
+    for lo, hi in sorted(roots + merged):
+        if result:
+            prev_lo, prev_hi = result[-1]
+            if lo < prev_hi or (lo == prev_hi and (lo == hi or prev_lo == prev_hi)):
+                result[-1] = (prev_lo, max(prev_hi, hi))
+                continue
+        result.append((lo, hi))
+    return result
@@ -1,7 +1,62 @@
-def iteration_method(fi, x0, eps, max_iter=50):
+import warnings
+
+import numpy as np
+
+
+def _sample(func, xs: np.ndarray) -> np.ndarray:
+    """Значения func на сетке xs: векторно, а если func не умеет — поточечно."""
+    try:
+        ys = np.asarray(func(xs), dtype=float)
+    except TypeError:
+        ys = np.array([func(x) for x in xs], dtype=float)
+    return np.broadcast_to(ys, xs.shape)
+
+
+def make_phi(f, a, b, fp=None, samples=201):
+    """
+    Строит φ(x) = x − f(x)/m для простой итерации на отрезке [a, b].
+
+    f' оценивается по равномерной сетке из samples точек (векторно; если fp
+    не задана — численным дифференцированием), и m выбирается так, чтобы
+    q = max|φ'(x)| = max|1 − f'(x)/m| был минимальным:
+        m = (min f' + max f') / 2,  q = (max f' − min f') / |max f' + min f'|.
+    Если f' меняет знак на [a, b], сжатия нет ни при каком m — выдаётся
+    предупреждение RuntimeWarning.
+
+    :return: (φ, m, q)
+    """
+    xs = np.linspace(min(a, b), max(a, b), samples)
+    if fp is not None:
+        d = _sample(fp, xs)
+    else:
+        d = np.gradient(_sample(f, xs), xs)
+
+    lo, hi = float(d.min()), float(d.max())
+    m = (lo + hi) / 2
+    if m == 0:
+        m = hi if hi != 0 else 1.0
+    q = float(np.max(np.abs(1 - d / m)))
+
+    if lo * hi <= 0:
+        warnings.warn(
+            f"f'(x) меняет знак на [{a}, {b}]: φ(x) = x − f(x)/m не будет "
+            "сжимающей ни при каком m. Сузьте отрезок.",
+            RuntimeWarning,
+        )
+    elif q >= 1:
+        warnings.warn(f"φ(x) не сжимающая на [{a}, {b}]: q = {q:.3g}", RuntimeWarning)
+
+    def phi(x):
+        return x - f(x) / m
+
+    return phi, m, q
+
+
+def iteration_method(fi, x0, eps, max_iter=50, trace=None):
     """
     Простой итерационный метод.
     fi — функция φ(x), преобразованная заранее.
+    trace — необязательный журнал итераций (tracing.SolverTrace).
     """
     x = x0
     n = 0
@@ -10,6 +65,8 @@ def iteration_method(fi, x0, eps, max_iter=50):
         xn = fi(x)
         dx = abs(xn - x)
         n += 1
+        if trace is not None:
+            trace.record(xn, dx)
 
         if n > max_iter:
             raise RuntimeError("Итераций > 50, метод расходится")
@@ -1,5 +1,5 @@
 import sys
-import math
+import warnings
 from io import BytesIO
 
 import numpy as np
@@ -15,6 +15,14 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QPixmap
 from PySide6.QtCore import Qt
 
+from tracing import SolverTrace
+from acceleration import accelerated_iteration, evaluations_saved
+from iteration import make_phi
+from isolation import isolate_roots
+from halley import halley, chebyshev
+from newton import newton_multiple
+from plot_graph import adaptive_sample
+
 
 # ==========================
 #   ФУНКЦИИ И ПРОИЗВОДНЫЕ
@@ -33,39 +41,33 @@ def f1pp(x: float) -> float:
     return 6 * x + 2.6
 
 
-def phi1(x: float) -> float:
-    # простая φ(x) для итерационного метода
-    m = 10.0
-    return x - f1(x) / m
-
+# f2 и её производные принимают и числа, и массивы точек:
+# φ для итерационного метода строится по векторной выборке f' на [a, b]
 
 def f2(x: float) -> float:
     # (x − 1)^2 = 0.5 e^x  →  (x − 1)^2 − 0.5 e^x = 0
-    return (x - 1) ** 2 - 0.5 * math.exp(x)
+    return (x - 1) ** 2 - 0.5 * np.exp(x)
 
 
 def f2p(x: float) -> float:
-    return 2 * (x - 1) - 0.5 * math.exp(x)
+    return 2 * (x - 1) - 0.5 * np.exp(x)
 
 
 def f2pp(x: float) -> float:
-    return 2 - 0.5 * math.exp(x)
-
-
-def phi2(x: float) -> float:
-    m = 5.0
-    return x - f2(x) / m
+    return 2 - 0.5 * np.exp(x)
 
 
 # ==========================
 #     ЧИСЛЕННЫЕ МЕТОДЫ
 # ==========================
 
-def dichotomy(f, a, b, eps, max_iter=100):
+def dichotomy(f, a, b, eps, max_iter=100, trace=None):
     n = 0
     while True:
         c = (a + b) / 2
         fc = f(c)
+        if trace is not None:
+            trace.record(c, (b - a) / 2)
 
         if abs(fc) < eps:
             return c, n + 1
@@ -80,7 +82,7 @@ def dichotomy(f, a, b, eps, max_iter=100):
             raise RuntimeError("Метод дихотомии: превышено число итераций")
 
 
-def chord(f, a, b, eps, max_iter=50):
+def chord(f, a, b, eps, max_iter=50, trace=None):
     if f(a) * f(b) >= 0:
         raise ValueError("Метод хорд: на интервале нет смены знака функции")
 
@@ -90,6 +92,8 @@ def chord(f, a, b, eps, max_iter=50):
     while True:
         bn = b - f(b) * (a - b) / (f(a) - f(b))
         n += 1
+        if trace is not None:
+            trace.record(bn, bn - prev)
 
         if abs(bn - prev) <= eps:
             return bn, n
@@ -101,7 +105,7 @@ def chord(f, a, b, eps, max_iter=50):
         b = bn
 
 
-def newton(f, fp, x0, eps, max_iter=50):
+def newton(f, fp, x0, eps, max_iter=50, trace=None):
     x = x0
     n = 0
 
@@ -111,6 +115,8 @@ def newton(f, fp, x0, eps, max_iter=50):
 
         x_new = x - f(x) / fp(x)
         n += 1
+        if trace is not None:
+            trace.record(x_new, x_new - x)
 
         if abs(x_new - x) <= eps:
             return x_new, n
@@ -121,7 +127,7 @@ def newton(f, fp, x0, eps, max_iter=50):
         x = x_new
 
 
-def combined_method(f, fp, a, b, eps, max_iter=50):
+def combined_method(f, fp, a, b, eps, max_iter=50, trace=None):
     if f(a) * f(b) >= 0:
         raise ValueError("Комбинированный метод: неверный интервал [a, b]")
 
@@ -135,6 +141,8 @@ def combined_method(f, fp, a, b, eps, max_iter=50):
 
         d = abs(bn - an)
         n += 1
+        if trace is not None:
+            trace.record((an + bn) / 2.0, d)
 
         if d <= eps:
             return (an + bn) / 2.0, n
@@ -145,13 +153,15 @@ def combined_method(f, fp, a, b, eps, max_iter=50):
         a, b = an, bn
 
 
-def iteration_method(phi, x0, eps, max_iter=50):
+def iteration_method(phi, x0, eps, max_iter=50, trace=None):
     x = x0
     n = 0
     while True:
         xn = phi(x)
         dx = abs(xn - x)
         n += 1
+        if trace is not None:
+            trace.record(xn, dx)
 
         if dx <= eps:
             return xn, n
@@ -186,10 +196,12 @@ def separate_root(f, fp, fpp, a_start=-10.0, step=0.5, max_steps=1000):
 
 
 def make_pixmap_for_function(f, a, b, root=None):
-    x = np.linspace(a, b, 200)
-    y = np.array([f(xi) for xi in x])
+    # точки сгущаются у корней и на изгибах, плоские участки — редкие;
+    # мельче пикселя рисунка отрезки не делятся
+    figsize, dpi = (4, 3), 110
+    x, y = adaptive_sample(f, a, b, pixels=figsize[0] * dpi)
 
-    fig, ax = plt.subplots(figsize=(4, 3), dpi=110)
+    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
 
     # линия функции
     ax.plot(x, y, label="f(x) — график функции")
@@ -273,49 +285,32 @@ class EquationsWindow(QWidget):
         methods_group = QGroupBox("Методы")
         m_layout = QGridLayout()
 
-        self.dich_root = QLineEdit()
-        self.chord_root = QLineEdit()
-        self.newton_root = QLineEdit()
-        self.comb_root = QLineEdit()
-        self.iter_root = QLineEdit()
-
-        self.dich_steps = QLineEdit()
-        self.chord_steps = QLineEdit()
-        self.newton_steps = QLineEdit()
-        self.comb_steps = QLineEdit()
-        self.iter_steps = QLineEdit()
-
-        for w in (
-            self.dich_root, self.chord_root, self.newton_root,
-            self.comb_root, self.iter_root,
-            self.dich_steps, self.chord_steps, self.newton_steps,
-            self.comb_steps, self.iter_steps
-        ):
-            w.setReadOnly(True)
+        # все поля результатов (для стиля и очистки)
+        self.result_edits = []
 
-        m_layout.addWidget(QLabel(""), 0, 1)
         m_layout.addWidget(QLabel("x*"), 0, 1)
         m_layout.addWidget(QLabel("шаги"), 0, 2)
-
-        m_layout.addWidget(QLabel("Дихотомии"), 1, 0)
-        m_layout.addWidget(self.dich_root, 1, 1)
-        m_layout.addWidget(self.dich_steps, 1, 2)
-
-        m_layout.addWidget(QLabel("Хорды"), 2, 0)
-        m_layout.addWidget(self.chord_root, 2, 1)
-        m_layout.addWidget(self.chord_steps, 2, 2)
-
-        m_layout.addWidget(QLabel("Касательные"), 3, 0)
-        m_layout.addWidget(self.newton_root, 3, 1)
-        m_layout.addWidget(self.newton_steps, 3, 2)
-
-        m_layout.addWidget(QLabel("Комбинированный"), 4, 0)
-        m_layout.addWidget(self.comb_root, 4, 1)
-        m_layout.addWidget(self.comb_steps, 4, 2)
-
-        m_layout.addWidget(QLabel("Итерационный"), 5, 0)
-        m_layout.addWidget(self.iter_root, 5, 1)
-        m_layout.addWidget(self.iter_steps, 5, 2)
+        m_layout.addWidget(QLabel("вызовы f / f'"), 0, 3)
+        m_layout.addWidget(QLabel("время, мс"), 0, 4)
+
+        (self.dich_root, self.dich_steps,
+         self.dich_evals, self.dich_time) = self._add_method_row(m_layout, 1, "Дихотомии")
+        (self.chord_root, self.chord_steps,
+         self.chord_evals, self.chord_time) = self._add_method_row(m_layout, 2, "Хорды")
+        (self.newton_root, self.newton_steps,
+         self.newton_evals, self.newton_time) = self._add_method_row(m_layout, 3, "Касательные")
+        (self.comb_root, self.comb_steps,
+         self.comb_evals, self.comb_time) = self._add_method_row(m_layout, 4, "Комбинированный")
+        (self.iter_root, self.iter_steps,
+         self.iter_evals, self.iter_time) = self._add_method_row(m_layout, 5, "Итерационный")
+        (self.steff_root, self.steff_steps,
+         self.steff_evals, self.steff_time) = self._add_method_row(m_layout, 6, "Стеффенсена")
+        (self.halley_root, self.halley_steps,
+         self.halley_evals, self.halley_time) = self._add_method_row(m_layout, 7, "Галлея")
+        (self.cheb_root, self.cheb_steps,
+         self.cheb_evals, self.cheb_time) = self._add_method_row(m_layout, 8, "Чебышёва")
+        (self.mult_root, self.mult_steps,
+         self.mult_evals, self.mult_time) = self._add_method_row(m_layout, 9, "Ньютона (кратн.)")
 
         methods_group.setLayout(m_layout)
 
@@ -350,18 +345,28 @@ class EquationsWindow(QWidget):
         layout.addWidget(methods_group, 1, 0)
         layout.addLayout(btn_layout,    1, 1)
 
-        self.resize(1050, 480)
+        self.resize(1250, 600)
+
+    def _add_method_row(self, m_layout, row, title):
+        """Строка панели методов: x*, шаги, вызовы f / f', время."""
+        edits = (QLineEdit(), QLineEdit(), QLineEdit(), QLineEdit())
+
+        m_layout.addWidget(QLabel(title), row, 0)
+        for col, w in enumerate(edits, start=1):
+            w.setReadOnly(True)
+            m_layout.addWidget(w, row, col)
+
+        self.result_edits.extend(edits)
+        return edits
 
     def setup_style(self):
-        for w in (
-            self.a_edit, self.b_edit, self.eps_edit,
-            self.dich_root, self.chord_root, self.newton_root,
-            self.comb_root, self.iter_root,
-            self.dich_steps, self.chord_steps, self.newton_steps,
-            self.comb_steps, self.iter_steps
-        ):
+        for w in (self.a_edit, self.b_edit, self.eps_edit):
             w.setFixedWidth(130)
 
+        # в строке метода: x* пошире, шаги / вызовы / время — короткие числа
+        for i, w in enumerate(self.result_edits):
+            w.setFixedWidth(130 if i % 4 == 0 else 80)
+
         self.setStyleSheet("""
         QWidget {
             background-color: #e8edf4;
@@ -411,12 +416,7 @@ class EquationsWindow(QWidget):
         """)
 
         # пометить readOnly для стиля
-        for w in (
-            self.dich_root, self.chord_root, self.newton_root,
-            self.comb_root, self.iter_root,
-            self.dich_steps, self.chord_steps, self.newton_steps,
-            self.comb_steps, self.iter_steps
-        ):
+        for w in self.result_edits:
             w.setProperty("readOnly", True)
             w.style().unpolish(w)
             w.style().polish(w)
@@ -425,9 +425,33 @@ class EquationsWindow(QWidget):
 
     def current_functions(self):
         if self.eq1_radio.isChecked():
-            return f1, f1p, f1pp, phi1
+            return f1, f1p, f1pp
         else:
-            return f2, f2p, f2pp, phi2
+            return f2, f2p, f2pp
+
+    @staticmethod
+    def show_result(edits, f, solve, note=None):
+        """
+        Запускает solve(trace) и выводит корень, шаги, вызовы f / f' и время.
+        note(x, n, ...) — необязательное пояснение в скобках после числа шагов
+        (получает всё, что вернул метод).
+        Возвращает найденный корень или None.
+        """
+        root_edit, steps_edit, evals_edit, time_edit = edits
+        trace = SolverTrace(f)
+        try:
+            x, n, *extra = solve(trace)
+        except Exception:
+            root_edit.setText("-")
+            for w in (steps_edit, evals_edit, time_edit):
+                w.setText("—")
+            return None
+
+        root_edit.setText(f"{x:.6f}")
+        steps_edit.setText(str(n) if note is None else f"{n} ({note(x, n, *extra)})")
+        evals_edit.setText(f"{trace.nf} / {trace.nd}")
+        time_edit.setText(f"{trace.elapsed * 1000:.3f}")
+        return x
 
     def read_params(self):
         try:
@@ -443,9 +467,20 @@ class EquationsWindow(QWidget):
     # --------- СЛОТЫ ---------
 
     def on_auto(self):
-        f, fp, fpp, _ = self.current_functions()
+        f, fp, fpp = self.current_functions()
         try:
-            a, b = separate_root(f, fp, fpp)
+            # интервальное отделение: все корни сразу, берём первый
+            intervals = isolate_roots(f, fp, fpp)
+            if not intervals:
+                raise RuntimeError("Не удалось автоматически отделить корень")
+            a, b = intervals[0]
+        except TypeError:
+            # функция не поддерживает интервальную арифметику — перебор с шагом
+            try:
+                a, b = separate_root(f, fp, fpp)
+            except Exception as e:
+                QMessageBox.warning(self, "Автоподбор", str(e))
+                return
         except Exception as e:
             QMessageBox.warning(self, "Автоподбор", str(e))
             return
@@ -454,7 +489,7 @@ class EquationsWindow(QWidget):
         self.b_edit.setText(f"{b:.4f}")
 
     def on_calc(self):
-        f, fp, fpp, phi = self.current_functions()
+        f, fp, fpp = self.current_functions()
 
         try:
             a, b, eps = self.read_params()
@@ -462,61 +497,88 @@ class EquationsWindow(QWidget):
             QMessageBox.warning(self, "Ошибка ввода", str(e))
             return
 
+        # φ(x) = x − f(x)/m с m, подобранным по f' на [a, b]
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            phi, _, _ = make_phi(f, a, b, fp=fp)
+        if caught:
+            QMessageBox.warning(self, "Итерационный метод", str(caught[0].message))
+
         # очищаем
-        for w in (
-            self.dich_root, self.chord_root, self.newton_root,
-            self.comb_root, self.iter_root,
-            self.dich_steps, self.chord_steps, self.newton_steps,
-            self.comb_steps, self.iter_steps
-        ):
+        for w in self.result_edits:
             w.clear()
 
-        root_for_plot = None
-
-        try:
-            x_d, n_d = dichotomy(f, a, b, eps)
-            self.dich_root.setText(f"{x_d:.6f}")
-            self.dich_steps.setText(str(n_d))
-            root_for_plot = x_d
-        except Exception as e:
-            self.dich_root.setText("-")
-            self.dich_steps.setText("—")
-
-        try:
-            x_c, n_c = chord(f, a, b, eps)
-            self.chord_root.setText(f"{x_c:.6f}")
-            self.chord_steps.setText(str(n_c))
-            root_for_plot = root_for_plot or x_c
-        except Exception:
-            self.chord_root.setText("-")
-            self.chord_steps.setText("—")
-
-        try:
-            x_n, n_n = newton(f, fp, (a + b) / 2, eps)
-            self.newton_root.setText(f"{x_n:.6f}")
-            self.newton_steps.setText(str(n_n))
-            root_for_plot = root_for_plot or x_n
-        except Exception:
-            self.newton_root.setText("-")
-            self.newton_steps.setText("—")
-
-        try:
-            x_cb, n_cb = combined_method(f, fp, a, b, eps)
-            self.comb_root.setText(f"{x_cb:.6f}")
-            self.comb_steps.setText(str(n_cb))
-            root_for_plot = root_for_plot or x_cb
-        except Exception:
-            self.comb_root.setText("-")
-            self.comb_steps.setText("—")
-
-        try:
-            x_it, n_it = iteration_method(phi, (a + b) / 2, eps)
-            self.iter_root.setText(f"{x_it:.6f}")
-            self.iter_steps.setText(str(n_it))
-            root_for_plot = root_for_plot or x_it
-        except Exception:
-            self.iter_root.setText("-")
-            self.iter_steps.setText("—")
+        x0 = (a + b) / 2
+        roots = []
+
+        # у каждого метода свой журнал: считает вызовы f, f' и время
+        roots.append(self.show_result(
+            (self.dich_root, self.dich_steps, self.dich_evals, self.dich_time), f,
+            lambda tr: dichotomy(tr.wrap(f), a, b, eps, trace=tr)))
+
+        roots.append(self.show_result(
+            (self.chord_root, self.chord_steps, self.chord_evals, self.chord_time), f,
+            lambda tr: chord(tr.wrap(f), a, b, eps, trace=tr)))
+
+        roots.append(self.show_result(
+            (self.newton_root, self.newton_steps, self.newton_evals, self.newton_time), f,
+            lambda tr: newton(tr.wrap(f), tr.wrap(fp, derivative=True), x0, eps, trace=tr)))
+
+        roots.append(self.show_result(
+            (self.comb_root, self.comb_steps, self.comb_evals, self.comb_time), f,
+            lambda tr: combined_method(tr.wrap(f), tr.wrap(fp, derivative=True),
+                                       a, b, eps, trace=tr)))
+
+        # вызовы φ простой и ускоренной итерации — чтобы сравнить их без
+        # повторного запуска простой итерации
+        phi_calls = {}
+
+        def run_plain(tr):
+            phi_calls["converged"] = False
+            try:
+                result = iteration_method(tr.wrap(phi), x0, eps, trace=tr)
+                phi_calls["converged"] = True
+                return result
+            finally:
+                phi_calls["plain"] = tr.nf
+
+        def run_fast(tr):
+            result = accelerated_iteration(tr.wrap(phi), x0, eps, trace=tr)
+            phi_calls["fast"] = tr.nf
+            return result
+
+        roots.append(self.show_result(
+            (self.iter_root, self.iter_steps, self.iter_evals, self.iter_time), f,
+            run_plain))
+
+        # та же φ, ускоренная Δ²-процессом; в скобках — сколько вызовов φ
+        # сэкономлено (оценка снизу, если простая итерация не сошлась)
+        roots.append(self.show_result(
+            (self.steff_root, self.steff_steps, self.steff_evals, self.steff_time), f,
+            run_fast,
+            note=lambda x, n: "{}−{} φ".format(
+                "" if phi_calls["converged"] else "≥ ",
+                evaluations_saved(phi_calls["plain"], phi_calls["fast"]))))
+
+        # методы третьего порядка: f, f' и f''
+        roots.append(self.show_result(
+            (self.halley_root, self.halley_steps, self.halley_evals, self.halley_time), f,
+            lambda tr: halley(tr.wrap(f), tr.wrap(fp, derivative=True),
+                              tr.wrap(fpp, derivative=True), x0, eps, trace=tr)))
+
+        roots.append(self.show_result(
+            (self.cheb_root, self.cheb_steps, self.cheb_evals, self.cheb_time), f,
+            lambda tr: chebyshev(tr.wrap(f), tr.wrap(fp, derivative=True),
+                                 tr.wrap(fpp, derivative=True), x0, eps, trace=tr)))
+
+        # Ньютон для кратных корней; в скобках — найденная кратность
+        roots.append(self.show_result(
+            (self.mult_root, self.mult_steps, self.mult_evals, self.mult_time), f,
+            lambda tr: newton_multiple(tr.wrap(f), tr.wrap(fp, derivative=True), x0, eps,
+                                       fpp=tr.wrap(fpp, derivative=True), trace=tr),
+            note=lambda x, n, m: f"m={m}"))
+
+        root_for_plot = next((r for r in roots if r is not None), None)
 
         # график
         try:
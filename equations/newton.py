@@ -1,7 +1,8 @@
-def newton(f, fp, x0, eps, max_iter=50):
+def newton(f, fp, x0, eps, max_iter=50, trace=None):
     """
     Метод Ньютона (касательных).
     Возвращает найденный корень и число итераций.
+    trace — необязательный журнал итераций (tracing.SolverTrace).
     """
     n = 0
     x = x0
@@ -14,6 +15,8 @@ def newton(f, fp, x0, eps, max_iter=50):
 
         x_new = x - f(x) / fp(x)
         n += 1
+        if trace is not None:
+            trace.record(x_new, x_new - x)
 
         if abs(x_new - x) <= eps:
             return x_new, n
@@ -22,3 +25,61 @@ def newton(f, fp, x0, eps, max_iter=50):
             raise RuntimeError("Количество итераций превысило допустимый предел")
 
         x = x_new
+
+
+def newton_multiple(f, fp, x0, eps, fpp=None, max_iter=50, trace=None):
+    """
+    Метод Ньютона для кратных корней.
+
+    Вместо f(x) = 0 решается u(x) = f(x) / f'(x) = 0: у u все корни простые,
+    поэтому квадратичная сходимость сохраняется и при кратном корне:
+        x_{k+1} = x_k − f f' / (f'² − f f'').
+    Кратность корня оценивается на ходу как m ≈ 1 / u'(x) = f'² / (f'² − f f'');
+    в ответ идёт оценка с предпоследней итерации — в последней точке f уже
+    на уровне ошибок округления и оценка недостоверна.
+    Если fp или fpp не заданы, производные берутся автоматическим
+    дифференцированием (autodiff.jet).
+    Возвращает найденный корень, число итераций и оценку кратности.
+    """
+    from autodiff import jet
+
+    n = 0
+    x = x0
+    m = None        # оценка кратности с предыдущей итерации
+
+    while True:
+        if fp is None or fpp is None:
+            fx, d1, d2 = jet(f, x)
+        else:
+            fx, d1, d2 = f(x), fp(x), fpp(x)
+
+        if fx == 0:
+            # попали точно в корень: кратность — по первой ненулевой производной
+            if m is None:
+                m = 1 if d1 != 0 else (2 if d2 != 0 else 3)
+            return x, n, m
+
+        if d1 == 0:
+            raise ZeroDivisionError(
+                "Производная равна 0 в точке, не являющейся корнем. "
+                "Требуется другое начальное приближение."
+            )
+
+        den = d1 * d1 - fx * d2
+        if den == 0:
+            raise ZeroDivisionError("Знаменатель шага обратился в 0.")
+
+        x_new = x - fx * d1 / den
+        m_new = max(1, round(d1 * d1 / den))
+        n += 1
+        if trace is not None:
+            trace.record(x_new, x_new - x)
+
+        if abs(x_new - x) <= eps:
+            return x_new, n, m if m is not None else m_new
+
+        if n > max_iter:
+            raise RuntimeError("Количество итераций превысило допустимый предел")
+
+        x = x_new
+        m = m_new
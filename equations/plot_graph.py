@@ -4,19 +4,95 @@ from io import BytesIO
 from PySide6.QtGui import QPixmap
 
 
+def _evaluate(f, x):
+    """f на массиве точек: векторно, а если f не умеет — поточечно."""
+    try:
+        y = np.asarray(f(x), dtype=float)
+    except TypeError:
+        y = np.array([f(xi) for xi in x], dtype=float)
+    return np.broadcast_to(y, x.shape).copy()
+
+
+def adaptive_sample(f, a, b, tol=1e-3, init=33, max_points=400, pixels=480):
+    """
+    Адаптивная сетка для графика f на [a, b].
+
+    Начинаем с init равномерных точек. На каждом проходе середины всех
+    «активных» отрезков вычисляются одним векторным вызовом f, и отрезок
+    делится дальше, только если:
+        * середина отклоняется от хорды больше чем на tol · (размах f) — кривизна;
+        * f меняет знак на отрезке — окрестность корня;
+        * значение не конечно — полюс.
+    Плоские участки остаются с редкими точками, у корней и на крутых
+    поворотах точки сгущаются. Отрезки уже одного пикселя (pixels — ширина
+    рисунка) не делятся: мельче разницы на экране не видно. Общее число
+    точек не превышает max_points;
+    если на очередном проходе бюджета не хватает на все активные отрезки,
+    делятся те, у которых отклонение от хорды на прошлом проходе было
+    наибольшим (окрестности корней и полюсов — в первую очередь).
+
+    :return: (x, y) — упорядоченные массивы точек графика
+    """
+    x = np.linspace(a, b, init)
+    y = _evaluate(f, x)
+
+    finite = y[np.isfinite(y)]
+    scale = float(np.ptp(finite)) if finite.size else 1.0
+    scale = scale or 1.0
+    min_width = abs(b - a) / pixels
+
+    active = np.ones(len(x) - 1, dtype=bool)
+    priority = np.zeros(len(x) - 1)         # отклонение от хорды у «родителя»
+    while active.any():
+        idx = np.flatnonzero(active)
+        budget = max_points - len(x)
+        if budget <= 0:
+            break
+        if idx.size > budget:
+            top = np.argpartition(-priority[idx], budget - 1)[:budget]
+            idx = np.sort(idx[top])
+
+        xm = 0.5 * (x[idx] + x[idx + 1])
+        ym = _evaluate(f, xm)
+        yl, yr = y[idx], y[idx + 1]
+
+        with np.errstate(invalid="ignore"):
+            deviation = np.abs(ym - 0.5 * (yl + yr)) / scale
+            curved = deviation > tol
+            crossing = (np.sign(yl) != np.sign(ym)) | (np.sign(ym) != np.sign(yr))
+        broken = ~(np.isfinite(yl) & np.isfinite(ym) & np.isfinite(yr))
+        refine = (curved | crossing | broken) & (x[idx + 1] - x[idx] > min_width)
+
+        # вставляем середины; левая половина отрезка idx[k] встаёт на место idx[k] + k
+        x = np.insert(x, idx + 1, xm)
+        y = np.insert(y, idx + 1, ym)
+        left = idx + np.arange(idx.size)
+
+        # у корней и полюсов отклонение может быть мало, но делить их важнее
+        score = np.where(crossing | broken, np.inf, deviation)
+
+        active = np.zeros(len(x) - 1, dtype=bool)
+        priority = np.zeros(len(x) - 1)
+        for half in (left[refine], left[refine] + 1):
+            active[half] = True
+            priority[half] = score[refine]
+
+    return x, y
+
+
 def plot_function(f, a, b, root=None):
     """
-    Рисует график функции f(x) на интервале [a, b] с 200 точками.
+    Рисует график функции f(x) на интервале [a, b] по адаптивной сетке.
     Если root задан — добавляет красную точку в корне.
     Возвращает QPixmap, готовый для установки в QLabel.
     """
 
-    # 1. Генерация сетки
-    x = np.linspace(a, b, 200)
-    y = f(x)
+    # 1. Адаптивная сетка
+    figsize, dpi = (4, 3), 120
+    x, y = adaptive_sample(f, a, b, pixels=figsize[0] * dpi)
 
     # 2. Построение графика
-    fig, ax = plt.subplots(figsize=(4, 3), dpi=120)
+    fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
     ax.plot(x, y, label="f(x)")
     ax.set_xlabel("X")
     ax.set_ylabel("F(X)")
@@ -0,0 +1,135 @@
+"""
+Корни полиномиальных уравнений через собственные числа
+матрицы-компаньона.
+
+Уравнения вида x^3 + 1.3x^2 − 4.7 = 0 — это полиномы, поэтому
+все их корни (включая комплексные) находятся сразу, без отделения
+корней и итераций по отрезкам.
+Коэффициенты задаются от старшей степени к младшей (как в np.roots).
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+
+def _trim_leading_zeros(coeffs: np.ndarray) -> np.ndarray:
+    """Убираем нулевые старшие коэффициенты."""
+    nz = np.flatnonzero(coeffs)
+    if nz.size == 0:
+        raise ValueError("Все коэффициенты полинома равны нулю")
+    return coeffs[nz[0]:]
+
+
+def companion_matrix(coeffs: Sequence[float]) -> np.ndarray:
+    """
+    Матрица-компаньон полинома a0*x^n + a1*x^(n-1) + ... + an.
+    Её собственные числа совпадают с корнями полинома.
+    """
+    c = _trim_leading_zeros(np.asarray(coeffs, dtype=complex))
+    n = len(c) - 1
+    if n < 1:
+        raise ValueError("Степень полинома должна быть не меньше 1")
+
+    C = np.zeros((n, n), dtype=complex)
+    C[0, :] = -c[1:] / c[0]          # первая строка — нормированные коэффициенты
+    C[1:, :-1] = np.eye(n - 1)       # единицы под главной диагональю
+    return C
+
+
+def _horner_with_derivative(cols, x: np.ndarray):
+    """
+    Значение полинома и его производной по схеме Горнера.
+    cols — коэффициенты от старшей степени (числа или столбцы (m, 1)
+    для набора полиномов), x — массив точек.
+    """
+    p = np.broadcast_to(cols[0], x.shape).astype(complex)
+    dp = np.zeros_like(p)
+    for a in cols[1:]:
+        dp = dp * x + p
+        p = p * x + a
+    return p, dp
+
+
+def _polish(cols, roots: np.ndarray, steps: int) -> np.ndarray:
+    """
+    Уточнение корней несколькими шагами метода Ньютона.
+    Шаг принимается только для тех корней, где он уменьшает |P(x)|.
+    """
+    x = roots.copy()
+    p, _ = _horner_with_derivative(cols, x)
+    for _ in range(steps):
+        _, dp = _horner_with_derivative(cols, x)
+        step = np.divide(p, dp, out=np.zeros_like(p), where=dp != 0)
+        x_new = x - step
+        p_new, _ = _horner_with_derivative(cols, x_new)
+
+        better = np.abs(p_new) < np.abs(p)
+        if not np.any(better):
+            break
+        x = np.where(better, x_new, x)
+        p = np.where(better, p_new, p)
+    return x
+
+
+def poly_roots(coeffs: Sequence[float], polish: int = 2) -> np.ndarray:
+    """
+    Все комплексные корни полинома.
+
+    :param coeffs: коэффициенты от старшей степени к младшей
+    :param polish: число уточняющих шагов Ньютона (0 — без уточнения)
+    :return: массив корней длины n (степень полинома)
+    """
+    c = _trim_leading_zeros(np.asarray(coeffs, dtype=complex))
+    if len(c) < 2:
+        return np.empty(0, dtype=complex)
+
+    roots = np.linalg.eigvals(companion_matrix(c))
+    if polish > 0:
+        roots = _polish(list(c), roots, polish)
+    return roots
+
+
+def poly_roots_batch(coeffs: np.ndarray, polish: int = 2) -> np.ndarray:
+    """
+    Корни сразу для набора полиномов одной степени.
+
+    Все матрицы-компаньоны складываются в один массив (m, n, n)
+    и обрабатываются одним вызовом np.linalg.eigvals.
+
+    :param coeffs: матрица (m, n+1), строка — коэффициенты одного полинома
+                   от старшей степени к младшей, старший коэффициент ≠ 0
+    :param polish: число уточняющих шагов Ньютона
+    :return: матрица корней (m, n)
+    """
+    c = np.atleast_2d(np.asarray(coeffs, dtype=complex))
+    m, n1 = c.shape
+    n = n1 - 1
+    if n < 1:
+        raise ValueError("Степень полиномов должна быть не меньше 1")
+    if np.any(c[:, 0] == 0):
+        raise ValueError("Старший коэффициент каждого полинома должен быть ненулевым")
+
+    C = np.zeros((m, n, n), dtype=complex)
+    C[:, 0, :] = -c[:, 1:] / c[:, :1]
+    idx = np.arange(n - 1)
+    C[:, idx + 1, idx] = 1.0
+
+    roots = np.linalg.eigvals(C)
+
+    if polish > 0:
+        # коэффициенты-столбцы (m, 1) транслируются на матрицу корней (m, n)
+        roots = _polish([c[:, k:k + 1] for k in range(n1)], roots, polish)
+    return roots
+
+
+def real_roots(roots: np.ndarray, tol: float = 1e-9) -> np.ndarray:
+    """Отбор вещественных корней (|Im| <= tol), отсортированных по возрастанию."""
+    roots = np.asarray(roots)
+    mask = np.abs(roots.imag) <= tol * np.maximum(1.0, np.abs(roots.real))
+    return np.sort(roots[mask].real)
+
+
+# Пример:
+# roots = poly_roots([1.0, 1.3, 0.0, -4.7])    # x^3 + 1.3x^2 − 4.7
+# print(real_roots(roots))
@@ -0,0 +1,230 @@
+"""
+Метод Ньютона для систем нелинейных уравнений F(x) = 0, x ∈ R^n.
+
+Построение матрицы Якоби — самая дорогая часть шага, поэтому:
+    * reuse = m — матрица (и её LU-разложение) пересчитывается раз в m шагов
+      (метод Шаманского; reuse=0 — метод хорд, матрица строится один раз);
+    * method="broyden" — квазиньютоновский метод Бройдена: после первого
+      построения матрица уточняется поправками ранга 1 без новых вызовов F;
+    * band=(l, u) — ленточная матрица (l поддиагоналей, u наддиагоналей):
+      конечные разности берутся группами столбцов за l + u + 1 вызовов F,
+      а LU-разложение и решение стоят O(n·l·u), так что n в тысячи — дёшево.
+
+Матрицу Якоби можно передать готовой функцией jac(x) (например, полученной
+автоматическим дифференцированием). Для ленточного случая jac(x) должна
+возвращать ленточное хранение ab формы (l + u + 1, n): ab[u + i − j, j] = J[i, j].
+"""
+
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+
+_SQRT_EPS = np.sqrt(np.finfo(float).eps)
+
+
+# ==========================
+#   КОНЕЧНЫЕ РАЗНОСТИ
+# ==========================
+
+def _fd_steps(x: np.ndarray) -> np.ndarray:
+    return _SQRT_EPS * np.maximum(np.abs(x), 1.0)
+
+
+def fd_jacobian(F, x: np.ndarray, Fx: np.ndarray) -> np.ndarray:
+    """Плотная матрица Якоби правыми разностями: n вызовов F."""
+    n = x.size
+    h = _fd_steps(x)
+    J = np.empty((Fx.size, n))
+    for j in range(n):
+        xj = x.copy()
+        xj[j] += h[j]
+        J[:, j] = (F(xj) - Fx) / h[j]
+    return J
+
+
+def fd_jacobian_banded(F, x: np.ndarray, Fx: np.ndarray, l: int, u: int) -> np.ndarray:
+    """
+    Ленточная матрица Якоби в хранении ab[u + i − j, j] = J[i, j].
+
+    Столбцы j ≡ g (mod l + u + 1) не пересекаются по строкам,
+    поэтому их можно возмущать одновременно: всего l + u + 1 вызовов F.
+    """
+    n = x.size
+    w = l + u + 1
+    h = _fd_steps(x)
+    ab = np.zeros((w, n))
+
+    for g in range(min(w, n)):
+        cols = np.arange(g, n, w)
+        xg = x.copy()
+        xg[cols] += h[cols]
+        dF = F(xg) - Fx
+
+        for d in range(-u, l + 1):          # строка i = j + d
+            rows = cols + d
+            ok = (rows >= 0) & (rows < n)
+            ab[u + d, cols[ok]] = dF[rows[ok]] / h[cols[ok]]
+    return ab
+
+
+# ==========================
+#   LU-РАЗЛОЖЕНИЯ
+# ==========================
+
+def _lu_factor(A: np.ndarray):
+    """LU-разложение с выбором главного элемента по столбцу."""
+    LU = np.array(A, dtype=float)
+    n = LU.shape[0]
+    piv = np.arange(n)
+
+    for k in range(n):
+        p = k + int(np.argmax(np.abs(LU[k:, k])))
+        if LU[p, k] == 0:
+            raise ZeroDivisionError("Матрица Якоби вырождена")
+        if p != k:
+            LU[[k, p]] = LU[[p, k]]
+            piv[[k, p]] = piv[[p, k]]
+        LU[k + 1:, k] /= LU[k, k]
+        LU[k + 1:, k + 1:] -= np.outer(LU[k + 1:, k], LU[k, k + 1:])
+    return LU, piv
+
+
+def _lu_solve(factors, b: np.ndarray) -> np.ndarray:
+    LU, piv = factors
+    y = np.array(b, dtype=float)[piv]
+    n = y.size
+    for i in range(1, n):                       # прямой ход (L)
+        y[i] -= LU[i, :i] @ y[:i]
+    for i in range(n - 1, -1, -1):              # обратный ход (U)
+        y[i] = (y[i] - LU[i, i + 1:] @ y[i + 1:]) / LU[i, i]
+    return y
+
+
+def _band_lu_factor(ab: np.ndarray, l: int, u: int):
+    """
+    LU-разложение ленточной матрицы без перестановок (как в прогонке):
+    подходит для матриц с диагональным преобладанием. O(n·l·u).
+    """
+    ab = np.array(ab, dtype=float)
+    n = ab.shape[1]
+
+    for k in range(n - 1):
+        pivot = ab[u, k]
+        if pivot == 0:
+            raise ZeroDivisionError(f"Ленточное LU: нулевой ведущий элемент на шаге {k}")
+        m = min(l, n - 1 - k)
+        if m == 0:
+            continue
+        ab[u + 1:u + m + 1, k] /= pivot                  # множители L[k+i, k]
+        for j in range(1, min(u, n - 1 - k) + 1):         # A[k+i, k+j] −= L·U[k, k+j]
+            ab[u + 1 - j:u + m + 1 - j, k + j] -= ab[u + 1:u + m + 1, k] * ab[u - j, k + j]
+
+    if ab[u, n - 1] == 0:
+        raise ZeroDivisionError("Ленточное LU: матрица вырождена")
+    return ab, l, u
+
+
+def _band_lu_solve(factors, b: np.ndarray) -> np.ndarray:
+    ab, l, u = factors
+    y = np.array(b, dtype=float)
+    n = y.size
+
+    for k in range(n - 1):
+        m = min(l, n - 1 - k)
+        y[k + 1:k + m + 1] -= ab[u + 1:u + m + 1, k] * y[k]
+
+    for k in range(n - 1, -1, -1):
+        j = np.arange(1, min(u, n - 1 - k) + 1)
+        y[k] = (y[k] - ab[u - j, k + j] @ y[k + j]) / ab[u, k]
+    return y
+
+
+# ==========================
+#   МЕТОД НЬЮТОНА
+# ==========================
+
+def newton_system(
+    F: Callable[[np.ndarray], np.ndarray],
+    x0,
+    eps: float,
+    jac: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    method: str = "newton",
+    reuse: Optional[int] = None,
+    band: Optional[Tuple[int, int]] = None,
+    max_iter: int = 50,
+) -> Tuple[np.ndarray, int, int]:
+    """
+    Решение системы F(x) = 0.
+
+    :param F: функция R^n -> R^n (принимает и возвращает numpy-массивы)
+    :param x0: начальное приближение
+    :param eps: точность по норме max|x_{k+1} − x_k|
+    :param jac: матрица Якоби J(x); если None — конечные разности
+    :param method: "newton" (Ньютон / Шаманский / хорды) или "broyden"
+    :param reuse: через сколько шагов пересчитывать матрицу Якоби
+                  (1 — классический Ньютон, 0 — метод хорд; по умолчанию
+                  1 для "newton" и 0 для "broyden")
+    :param band: (l, u) — ширина ленты матрицы Якоби
+    :param max_iter: максимальное число итераций
+    :return: (x, число итераций, число построений матрицы Якоби)
+    """
+    if method not in ("newton", "broyden"):
+        raise ValueError(f"Неизвестный метод: {method}")
+    if reuse is None:
+        reuse = 1 if method == "newton" else 0
+
+    x = np.array(x0, dtype=float)
+    Fx = np.asarray(F(x), dtype=float)
+
+    def factorize():
+        if band is None:
+            J = jac(x) if jac is not None else fd_jacobian(F, x, Fx)
+            return _lu_factor(J), _lu_solve
+        l, u = band
+        ab = jac(x) if jac is not None else fd_jacobian_banded(F, x, Fx, l, u)
+        return _band_lu_factor(ab, l, u), _band_lu_solve
+
+    factors, solve = factorize()
+    n_jac = 1
+    age = 0                 # сколько шагов сделано с текущей матрицей
+    steps = []              # шаги s_j для поправок Бройдена
+    norm_prev = np.max(np.abs(Fx))
+    n = 0
+
+    while True:
+        if method == "broyden" and steps:
+            # z = H_k F(x) через H_0 и накопленные поправки ранга 1:
+            # H_{k+1} = (I + s_{k+1} s_kᵀ / |s_k|²) H_k
+            z = solve(factors, Fx)
+            for s_j, s_next in zip(steps[:-1], steps[1:]):
+                z += s_next * (s_j @ z) / (s_j @ s_j)
+            s_last = steps[-1]
+            dx = -z / (1.0 + (s_last @ z) / (s_last @ s_last))
+        else:
+            dx = -solve(factors, Fx)
+
+        x = x + dx
+        Fx = np.asarray(F(x), dtype=float)
+        n += 1
+        age += 1
+
+        if np.max(np.abs(dx)) <= eps or not np.any(Fx):
+            return x, n, n_jac
+
+        if n > max_iter:
+            raise RuntimeError("Метод Ньютона для систем: превышено число итераций")
+
+        norm = np.max(np.abs(Fx))
+        if method == "broyden":
+            steps.append(dx)
+
+        # матрицу пересчитываем по расписанию или когда невязка перестала
+        # заметно убывать (устаревшая матрица начала мешать сходимости)
+        stale = reuse > 0 and age >= reuse
+        if stale or norm > 0.5 * norm_prev:
+            factors, solve = factorize()
+            n_jac += 1
+            age = 0
+            steps = []
+        norm_prev = norm
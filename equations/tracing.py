@@ -0,0 +1,100 @@
+"""
+Журнал итераций для методов решения уравнений.
+
+SolverTrace считает вызовы f и её производных, а на каждой итерации
+запоминает x, |f(x)|, длину шага, счётчики вызовов и время от старта.
+Журнал выдаётся структурированным массивом NumPy, по нему же
+оценивается эмпирический порядок сходимости.
+
+Пример:
+    tr = SolverTrace(f1)
+    x, n = newton(tr.wrap(f1), tr.wrap(f1p, derivative=True), x0, eps, trace=tr)
+    tr.to_array()["fx"], tr.convergence_order()
+"""
+
+import math
+import time
+from typing import Callable
+
+import numpy as np
+
+
+TRACE_DTYPE = np.dtype([
+    ("n", np.int64),        # номер итерации
+    ("x", np.float64),      # текущее приближение
+    ("fx", np.float64),     # |f(x)|
+    ("step", np.float64),   # |x_k − x_{k−1}| (для дихотомии — полуширина отрезка)
+    ("nf", np.int64),       # вызовов f (или φ) к этому моменту
+    ("nd", np.int64),       # вызовов производных к этому моменту
+    ("t", np.float64),      # секунд от начала решения
+])
+
+
+class SolverTrace:
+    """Счётчики вызовов и журнал итераций одного запуска метода."""
+
+    def __init__(self, f: Callable[[float], float]):
+        # исходная f нужна только для записи |f(x)| и в счётчики не входит
+        self._f = f
+        self.nf = 0
+        self.nd = 0
+        self._rows = []
+        self._t0 = time.perf_counter()
+        self._overhead = 0.0        # время на служебные вычисления |f(x)| в record
+
+    def wrap(self, func: Callable[[float], float], derivative: bool = False):
+        """Обёртка над func, которая считает её вызовы."""
+        def counted(x):
+            if derivative:
+                self.nd += 1
+            else:
+                self.nf += 1
+            return func(x)
+        return counted
+
+    def record(self, x: float, step: float, fx: float = None) -> None:
+        """
+        Вызывается методом в конце каждой итерации.
+        fx — уже вычисленное методом f(x); если не передано, f вызывается
+        здесь, но ни в счётчики, ни во время решения этот вызов не входит.
+        """
+        now = time.perf_counter()
+        t = now - self._t0 - self._overhead
+        if fx is None:
+            fx = self._f(x)
+            self._overhead += time.perf_counter() - now
+        self._rows.append((
+            len(self._rows) + 1, x, abs(fx), abs(step),
+            self.nf, self.nd, t,
+        ))
+
+    # ---------- результаты ----------
+
+    def to_array(self) -> np.ndarray:
+        return np.array(self._rows, dtype=TRACE_DTYPE)
+
+    @property
+    def evaluations(self) -> int:
+        """Всего вызовов f и производных."""
+        return self.nf + self.nd
+
+    @property
+    def elapsed(self) -> float:
+        """Время решения в секундах (до последней записанной итерации)."""
+        return self._rows[-1][6] if self._rows else 0.0
+
+    def convergence_order(self) -> float:
+        """
+        Эмпирический порядок сходимости по трём последним шагам:
+            q ≈ ln(s_{k+1} / s_k) / ln(s_k / s_{k−1}).
+        Возвращает nan, если шагов меньше трёх или они вырождены.
+        """
+        steps = [r[3] for r in self._rows if r[3] > 0]
+        if len(steps) < 3:
+            return float("nan")
+
+        s0, s1, s2 = steps[-3:]
+        den = math.log(s1 / s0)
+        if den == 0:
+            return float("nan")
+        return math.log(s2 / s1) / den
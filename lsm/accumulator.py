@@ -0,0 +1,151 @@
+from typing import Iterable, Tuple
+import numpy as np
+
+
+class LeastSquaresAccumulator:
+    """
+    Накопитель достаточных статистик МНК для трёх моделей:
+        y = a*x + b,  y = a*x^2 + b*x + c,  y = a/x + b.
+
+    Хранятся только суммы (Σt^k, Σt^k*y, Σy^2 и суммы с 1/x), поэтому
+    добавление и удаление точки — O(1), а коэффициенты и сумма квадратов
+    отклонений S получаются из нормальной системы 2x2 или 3x3 независимо
+    от числа точек.
+
+    Суммы считаются по сдвинутым данным: t = x - x0 (для полиномиальных
+    моделей) и u = y - y0 (для всех), где (x0, y0) — первая добавленная
+    точка. Так степени x^4 не теряют точность при больших x, а
+    S = Σu^2 - p·g не теряет её при большом y. Все три модели содержат
+    свободный член, поэтому сдвиг y лишь переносит его на y0.
+    Для обратной модели точки с x = 0 не учитываются, но
+    считаются — при их наличии модель не строится (как в reciprocal.py).
+    """
+
+    def __init__(self) -> None:
+        self.clear()
+
+    @classmethod
+    def from_points(
+        cls,
+        x_vals: Iterable[float],
+        y_vals: Iterable[float],
+    ) -> "LeastSquaresAccumulator":
+        acc = cls()
+        for x, y in zip(x_vals, y_vals):
+            acc.add(x, y)
+        return acc
+
+    def clear(self) -> None:
+        self.n = 0
+        self.shift = 0.0
+        self.y_shift = 0.0
+        self.st = np.zeros(5)       # Σt^k, k = 0..4
+        self.sty = np.zeros(3)      # Σt^k*u, k = 0..2
+        self.syy = 0.0              # Σu^2
+
+        self.zeros = 0              # точек с x = 0
+        self.sz = np.zeros(3)       # Σz^k, z = 1/x, k = 0..2 (по x != 0)
+        self.szy = np.zeros(2)      # Σz^k*u, k = 0..1
+        self.szyy = 0.0             # Σu^2 по x != 0
+
+    def _update(self, x: float, y: float, sign: float) -> None:
+        t = x - self.shift
+        y = y - self.y_shift
+        p = t ** np.arange(5)
+        self.st += sign * p
+        self.sty += sign * p[:3] * y
+        self.syy += sign * y * y
+
+        if x == 0:
+            self.zeros += int(sign)
+            return
+        q = (1.0 / x) ** np.arange(3)
+        self.sz += sign * q
+        self.szy += sign * q[:2] * y
+        self.szyy += sign * y * y
+
+    def add(self, x: float, y: float) -> None:
+        """Добавляет точку (x, y) за O(1)."""
+        if self.n == 0:
+            self.clear()
+            self.shift = float(x)
+            self.y_shift = float(y)
+        self._update(float(x), float(y), 1.0)
+        self.n += 1
+
+    def remove(self, x: float, y: float) -> None:
+        """Удаляет ранее добавленную точку (x, y) за O(1)."""
+        if self.n == 0:
+            raise ValueError("Нет точек для удаления")
+        self._update(float(x), float(y), -1.0)
+        self.n -= 1
+        if self.n == 0:
+            self.clear()            # сбрасываем накопившуюся погрешность
+
+    def condition(self, degree: int) -> float:
+        """
+        Число обусловленности нормальной матрицы полинома степени degree
+        (после выравнивания диагонали). Нормальные уравнения теряют примерно
+        log10(condition) верных знаков — при большом значении результат
+        лучше пересчитать QR-разложением (polyfit.PolyFitter).
+        """
+        s = self.st
+        k = degree + 1
+        return self._cond(np.array([[s[i + j] for j in range(k)] for i in range(k)]))
+
+    def reciprocal_condition(self) -> float:
+        """То же, что condition(1), для обратной модели (суммы по z = 1/x)."""
+        s = self.sz
+        return self._cond(np.array([[s[2], s[1]], [s[1], s[0]]]))
+
+    @staticmethod
+    def _cond(A: np.ndarray) -> float:
+        d = np.sqrt(np.diag(A))
+        if np.any(d == 0):
+            return float("inf")
+        return float(np.linalg.cond(A / np.outer(d, d)))
+
+    @staticmethod
+    def _solve(A: np.ndarray, g: np.ndarray, syy: float):
+        """Решение A p = g и S = Σu^2 - p·g (следует из A p = g)."""
+        p = np.linalg.solve(A, g)
+        S = max(float(syy - p @ g), 0.0)
+        return p, S
+
+    def linear(self) -> Tuple[float, float, float]:
+        """(a, b, S) для y = a*x + b."""
+        s = self.st
+        A = np.array([[s[0], s[1]], [s[1], s[2]]])
+        try:
+            (b, a), S = self._solve(A, self.sty[:2], self.syy)
+        except np.linalg.LinAlgError:
+            return 0.0, 0.0, float("nan")
+        # y - y0 = a*t + b, t = x - x0
+        return float(a), float(b - a * self.shift + self.y_shift), S
+
+    def quadratic(self) -> Tuple[float, float, float, float]:
+        """(a, b, c, S) для y = a*x^2 + b*x + c."""
+        s = self.st
+        A = np.array([[s[0], s[1], s[2]], [s[1], s[2], s[3]], [s[2], s[3], s[4]]])
+        try:
+            (c, b, a), S = self._solve(A, self.sty, self.syy)
+        except np.linalg.LinAlgError:
+            return 0.0, 0.0, 0.0, float("nan")
+        # y - y0 = a*t^2 + b*t + c, t = x - x0
+        x0 = self.shift
+        c0 = a * x0 * x0 - b * x0 + c + self.y_shift
+        return float(a), float(b - 2 * a * x0), float(c0), S
+
+    def reciprocal(self) -> Tuple[float, float, float]:
+        """(a, b, S) для y = a/x + b."""
+        if self.zeros:
+            raise ValueError("Значения x не должны быть равны нулю.")
+        s = self.sz
+        A = np.array([[s[2], s[1]], [s[1], s[0]]])
+        g = np.array([self.szy[1], self.szy[0]])
+        try:
+            (a, b), S = self._solve(A, g, self.szyy)
+        except np.linalg.LinAlgError:
+            return 0.0, 0.0, float("nan")
+        # y - y0 = a/x + b
+        return float(a), float(b + self.y_shift), S
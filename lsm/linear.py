@@ -1,6 +1,8 @@
 from typing import Sequence, Tuple
 import numpy as np
 
+from polyfit import polyfit_qr
+
 
 def linear_least_squares(
     x_vals: Sequence[float],
@@ -21,23 +23,13 @@ def linear_least_squares(
     if x.shape != y.shape:
         raise ValueError("x_vals и y_vals должны иметь одинаковую длину")
 
-    # Матрица X: первый столбец единицы, второй — x
-    X = np.column_stack((np.ones_like(x), x))
-
-    # Решаем систему (X^T X) p = X^T y
-    XtX = X.T @ X
-    XtY = X.T @ y
-
+    # Полином степени 1 через QR (без нормальных уравнений)
     try:
-        coeffs = np.linalg.solve(XtX, XtY)
+        coeffs, S = polyfit_qr(x, y, 1)
     except np.linalg.LinAlgError:
         # На случай вырожденной системы
         return 0.0, 0.0, float("nan")
 
-    b, a = coeffs  # порядок (b, a), см. p = [b, a]^T
-
-    # Считаем сумму квадратов отклонений
-    residuals = a * x + b - y
-    S = float(np.sum(residuals ** 2))
+    b, a = coeffs  # порядок (b, a) — по возрастанию степеней
 
-    return float(a), float(b), S
+    return float(a), float(b), float(S)
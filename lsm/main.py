@@ -23,11 +23,17 @@ from PySide6.QtCore import Qt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+from accumulator import LeastSquaresAccumulator
 from linear import linear_least_squares
 from quadratic import quadratic_least_squares
 from reciprocal import reciprocal_least_squares
 
 
+# выше этого числа обусловленности нормальные уравнения накопителя
+# теряют больше половины знаков — тогда модели пересчитываются через QR
+COND_LIMIT = 1e8
+
+
 # --- данные варианта (можно подредактировать под свою таблицу) ---
 DEFAULT_POINTS: List[Tuple[float, float]] = [
     (0.07, 0.00912),
@@ -53,6 +59,8 @@ class LSMWindow(QMainWindow):
 
         self.x_vals: List[float] = []
         self.y_vals: List[float] = []
+        # суммы для МНК, обновляются вместе со списками точек
+        self.acc = LeastSquaresAccumulator()
 
         self._build_ui()
         self._apply_styles()
@@ -284,6 +292,7 @@ class LSMWindow(QMainWindow):
 
         self.x_vals.append(x)
         self.y_vals.append(y)
+        self.acc.add(x, y)
         self.edit_x_new.clear()
         self.edit_y_new.clear()
         self.refresh_lists()
@@ -293,6 +302,7 @@ class LSMWindow(QMainWindow):
     def on_auto_fill(self) -> None:
         self.x_vals = [p[0] for p in DEFAULT_POINTS]
         self.y_vals = [p[1] for p in DEFAULT_POINTS]
+        self.acc = LeastSquaresAccumulator.from_points(self.x_vals, self.y_vals)
         self.refresh_lists()
         self._clear_results()
         self._clear_plot()
@@ -303,6 +313,7 @@ class LSMWindow(QMainWindow):
             QMessageBox.information(self, "Удаление", "Выберите строку в списке X.")
             return
 
+        self.acc.remove(self.x_vals[row], self.y_vals[row])
         del self.x_vals[row]
         del self.y_vals[row]
         self.refresh_lists()
@@ -312,6 +323,7 @@ class LSMWindow(QMainWindow):
     def on_clear_all(self) -> None:
         self.x_vals.clear()
         self.y_vals.clear()
+        self.acc.clear()
         self.refresh_lists()
         self._clear_results()
         self._clear_plot()
@@ -350,21 +362,37 @@ class LSMWindow(QMainWindow):
         x = self.x_vals
         y = self.y_vals
 
+        # коэффициенты — из накопленных сумм, без повторного прохода по точкам;
+        # если нормальная система плохо обусловлена — QR по самим точкам
+
         # линейная
-        a_lin, b_lin, s_lin = linear_least_squares(x, y)
+        if self.acc.condition(1) > COND_LIMIT:
+            a_lin, b_lin, s_lin = linear_least_squares(x, y)
+        else:
+            a_lin, b_lin, s_lin = self.acc.linear()
         self.lin_a.setText(f"{a_lin:.6g}")
         self.lin_b.setText(f"{b_lin:.6g}")
         self.lin_sumsq.setText(f"{s_lin:.6g}")
 
         # квадратичная
-        a_q, b_q, c_q, s_q = quadratic_least_squares(x, y)
+        if self.acc.condition(2) > COND_LIMIT:
+            a_q, b_q, c_q, s_q = quadratic_least_squares(x, y)
+        else:
+            a_q, b_q, c_q, s_q = self.acc.quadratic()
         self.quad_a.setText(f"{a_q:.6g}")
         self.quad_b.setText(f"{b_q:.6g}")
         self.quad_c.setText(f"{c_q:.6g}")
         self.quad_sumsq.setText(f"{s_q:.6g}")
 
         # обратная
-        a_r, b_r, s_r = reciprocal_least_squares(x, y)
+        try:
+            if self.acc.reciprocal_condition() > COND_LIMIT:
+                a_r, b_r, s_r = reciprocal_least_squares(x, y)
+            else:
+                a_r, b_r, s_r = self.acc.reciprocal()
+        except ValueError as e:
+            QMessageBox.warning(self, "Обратная модель", str(e))
+            return
         self.rec_a.setText(f"{a_r:.6g}")
         self.rec_b.setText(f"{b_r:.6g}")
         self.rec_sumsq.setText(f"{s_r:.6g}")
@@ -1,6 +1,8 @@
 from typing import Sequence, Tuple
 import numpy as np
 
+from polyfit import polyfit_qr
+
 
 def quadratic_least_squares(
     x_vals: Sequence[float],
@@ -21,23 +23,13 @@ def quadratic_least_squares(
     if x.shape != y.shape:
         raise ValueError("x_vals и y_vals должны иметь одинаковую длину")
 
-    # Матрица X: [1, x, x^2]
-    X = np.column_stack((np.ones_like(x), x, x**2))
-
-    XtX = X.T @ X
-    XtY = X.T @ y
-
+    # Полином степени 2 через QR (без нормальных уравнений)
     try:
-        coeffs = np.linalg.solve(XtX, XtY)
+        coeffs, S = polyfit_qr(x, y, 2)
     except np.linalg.LinAlgError:
         # Вырожденная система
         return 0.0, 0.0, 0.0, float("nan")
 
-    c, b, a = coeffs  # порядок (c, b, a) как в p
-
-    # Сумма квадратов отклонений
-    y_pred = a * x**2 + b * x + c
-    residuals = y_pred - y
-    S = float(np.sum(residuals**2))
+    c, b, a = coeffs  # порядок (c, b, a) — по возрастанию степеней
 
-    return float(a), float(b), float(c), S
+    return float(a), float(b), float(c), float(S)
@@ -1,5 +1,7 @@
-import numpy as np
 from typing import Sequence, Tuple
+import numpy as np
+
+from polyfit import polyfit_qr
 
 
 def reciprocal_least_squares(
@@ -13,20 +15,21 @@ def reciprocal_least_squares(
     x = np.asarray(x_vals, dtype=float)
     y = np.asarray(y_vals, dtype=float)
 
+    if x.shape != y.shape:
+        raise ValueError("x_vals и y_vals должны иметь одинаковую длину")
+
     if np.any(x == 0):
         raise ValueError("Значения x не должны быть равны нулю.")
 
-    z = 1 / x  # преобразование
-
-    # Матрица для линейной аппроксимации
-    X = np.column_stack((z, np.ones_like(z)))
+    z = 1 / x  # преобразование: y = a*z + b — прямая по z
 
-    # Решаем систему МНК
-    coeffs = np.linalg.lstsq(X, y, rcond=None)[0]
-    a, b = coeffs
+    # Полином степени 1 по z через QR (без нормальных уравнений)
+    try:
+        coeffs, S = polyfit_qr(z, y, 1)
+    except np.linalg.LinAlgError:
+        # На случай вырожденной системы (все x одинаковы)
+        return 0.0, 0.0, float("nan")
 
-    # Ошибка аппроксимации
-    y_pred = a / x + b
-    S = float(np.sum((y_pred - y) ** 2))
+    b, a = coeffs  # порядок (b, a) — по возрастанию степеней z
 
-    return float(a), float(b), S
+    return float(a), float(b), float(S)
@@ -0,0 +1,65 @@
+"""Проверки накопителя МНК: добавление / удаление точек против пересчёта с нуля."""
+
+import numpy as np
+
+from accumulator import LeastSquaresAccumulator
+from linear import linear_least_squares
+from quadratic import quadratic_least_squares
+from reciprocal import reciprocal_least_squares
+
+
+def _values(model, params, x):
+    if model == "linear":
+        a, b = params
+        return a * x + b
+    if model == "quadratic":
+        a, b, c = params
+        return (a * x + b) * x + c
+    a, b = params
+    return a / x + b
+
+
+def _assert_models_match(acc, x, y, reciprocal=True):
+    # сравниваются значения модели в точках и S: сами коэффициенты при
+    # больших x плохо обусловлены у любого метода
+    pairs = [("linear", acc.linear(), linear_least_squares(x, y)),
+             ("quadratic", acc.quadratic(), quadratic_least_squares(x, y))]
+    if reciprocal:
+        pairs.append(("reciprocal", acc.reciprocal(), reciprocal_least_squares(x, y)))
+    for model, got, ref in pairs:
+        assert np.allclose(_values(model, got[:-1], x), _values(model, ref[:-1], x),
+                           rtol=1e-12, atol=1e-9)
+        assert np.isclose(got[-1], ref[-1], rtol=1e-6, atol=1e-12)
+
+
+def test_add_remove_matches_batch_fit():
+    rng = np.random.default_rng(0)
+    x = rng.uniform(0.5, 3.0, 40)
+    y = 1.5 / x + 0.3 * x * x - x + rng.normal(0.0, 0.05, 40)
+
+    acc = LeastSquaresAccumulator.from_points(x, y)
+    _assert_models_match(acc, x, y)
+
+    keep = np.ones(40, dtype=bool)
+    keep[[3, 17, 25, 38]] = False
+    for xi, yi in zip(x[~keep], y[~keep]):
+        acc.remove(xi, yi)
+    _assert_models_match(acc, x[keep], y[keep])
+
+
+def test_large_offsets_keep_residual():
+    x = 1000.0 + np.linspace(0.0, 1.0, 25)
+    y = 1e6 + 2.0 * x + 0.01 * np.sin(20 * x)
+
+    # сдвиг на первую точку спасает полиномиальные модели; суммы по 1/x
+    # не сдвигаются, и обратная модель здесь плохо обусловлена (для неё
+    # окно переходит на QR, см. reciprocal_condition)
+    acc = LeastSquaresAccumulator.from_points(x, y)
+    _assert_models_match(acc, x, y, reciprocal=False)
+
+
+def test_remove_all_points_resets():
+    acc = LeastSquaresAccumulator.from_points([1.0, 2.0], [3.0, 4.0])
+    acc.remove(1.0, 3.0)
+    acc.remove(2.0, 4.0)
+    assert acc.n == 0 and acc.syy == 0.0 and not acc.st.any()
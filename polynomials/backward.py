@@ -0,0 +1,17 @@
+def backward_pass(cp, fp):
+    """
+    Обратный ход метода прогонки.
+    cp, fp — массивы α_i и β_i из прямого хода.
+    Возвращает массив внутренних узлов y_i.
+    """
+    n = len(fp)
+    y = [0.0] * n
+
+    # последний внутренний узел
+    y[-1] = fp[-1]
+
+    # восстановление остальных: i = n-2, ..., 0
+    for i in range(n - 2, -1, -1):
+        y[i] = fp[i] - cp[i] * y[i + 1]
+
+    return y
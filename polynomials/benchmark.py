@@ -0,0 +1,189 @@
+"""
+Замеры скорости и точности методов интерполяции (без Qt).
+
+Для каждого метода, распределения узлов, тестовой функции и числа узлов n
+записывается:
+    build_s          — время подготовки (веса, разности, коэффициенты);
+    eval_per_point_s — время вычисления P(x) в расчёте на одну точку;
+    peak_bytes       — пик выделенной памяти (tracemalloc) за оба этапа;
+    max_error        — max |P(x) − f(x)| на контрольной сетке.
+Результат пишется в JSON, чтобы сравнивать версии между собой.
+
+Запуск:
+    python benchmark.py --out bench.json
+    python benchmark.py --n-max 1000 --methods lagrange spline
+"""
+
+import argparse
+import json
+import math
+import platform
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from lagrange import barycentric, barycentric_weights
+from newton import NewtonInterpolant
+from vandermonde import _cached, bjorck_pereyra
+from matrix import eval_poly, matrix_method
+from spline import CubicSpline
+
+
+# ---------- тестовые функции на [−1, 1] ----------
+
+FUNCTIONS = {
+    "runge": lambda x: 1.0 / (1.0 + 25.0 * x * x),
+    "sin": lambda x: np.sin(3.0 * x),
+    "exp": np.exp,
+}
+
+
+# ---------- распределения узлов ----------
+
+def _equispaced(n, rng):
+    return np.linspace(-1.0, 1.0, n)
+
+
+def _chebyshev(n, rng):
+    return -np.cos(np.arange(n) * np.pi / (n - 1))
+
+
+def _random(n, rng):
+    x = np.sort(rng.uniform(-1.0, 1.0, n - 2))
+    return np.concatenate([[-1.0], x, [1.0]])
+
+
+DISTRIBUTIONS = {
+    "equispaced": _equispaced,
+    "chebyshev": _chebyshev,
+    "random": _random,
+}
+
+
+# ---------- методы: (построение, вычисление, наибольшее n) ----------
+# Построение — то, что соответствующая функция делает при каждом вызове
+# (lagrange, newton_interpolation, canonical_polynomial, matrix_method);
+# ограничение n — чтобы O(n²) по памяти или Python-циклы не шли часами.
+
+def _build_lagrange(xs, ys):
+    return xs, ys, barycentric_weights(xs)
+
+
+def _eval_lagrange(state, x):
+    return barycentric(x, *state)
+
+
+def _build_canonical(xs, ys):
+    return bjorck_pereyra(xs, ys)
+
+
+def _build_matrix(xs, ys):
+    # matrix_method берёт коэффициенты из кэша vandermonde_coeffs; _measure
+    # строит дважды (время и память), и без очистки второй раз был бы
+    # попаданием в кэш — замер должен включать само решение системы
+    _cached.cache_clear()
+    return matrix_method(xs, ys)
+
+
+METHODS = {
+    "lagrange": (_build_lagrange, _eval_lagrange, 20000),
+    "newton": (NewtonInterpolant, lambda p, x: p(x), 1000),
+    "canonical": (_build_canonical, eval_poly, 5000),
+    "matrix": (_build_matrix, eval_poly, 5000),
+    "spline": (CubicSpline, lambda s, x: s(x), 100000),
+}
+
+
+def _node_counts(n_max):
+    counts = []
+    for decade in (1, 10, 100, 1000, 10000, 100000):
+        for mult in (5, 10, 20):
+            n = mult * decade
+            if 5 <= n <= n_max and n not in counts:
+                counts.append(n)
+    return counts
+
+
+def _measure(build, evaluate, xs, ys, x_test, y_test):
+    # время — без tracemalloc: трассировка замедляет выделение памяти
+    # в десятки раз и исказила бы build_s и eval_per_point_s
+    t0 = time.perf_counter()
+    state = build(xs, ys)
+    t1 = time.perf_counter()
+    y = evaluate(state, x_test)
+    t2 = time.perf_counter()
+
+    # память — отдельным повторным прогоном под tracemalloc
+    del state
+    tracemalloc.start()
+    evaluate(build(xs, ys), x_test)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    err = float(np.max(np.abs(y - y_test)))
+    return {
+        "build_s": t1 - t0,
+        "eval_per_point_s": (t2 - t1) / len(x_test),
+        "peak_bytes": peak,
+        # inf/nan в JSON не записать — расходимость отмечаем как null
+        "max_error": err if math.isfinite(err) else None,
+    }
+
+
+def run(methods, distributions, functions, n_max, points, seed=0):
+    """Полный перебор; возвращает список записей-словарей."""
+    rng = np.random.default_rng(seed)
+    x_test = np.linspace(-1.0, 1.0, points)
+    results = []
+
+    for method in methods:
+        build, evaluate, cap = METHODS[method]
+        for dist in distributions:
+            for n in _node_counts(min(n_max, cap)):
+                xs = DISTRIBUTIONS[dist](n, rng)
+                for fname in functions:
+                    f = FUNCTIONS[fname]
+                    record = {"method": method, "nodes": dist, "function": fname, "n": n}
+                    try:
+                        with np.errstate(all="ignore"):
+                            record.update(_measure(build, evaluate, xs, f(xs), x_test, f(x_test)))
+                    except (ValueError, ZeroDivisionError, np.linalg.LinAlgError) as e:
+                        record["error"] = str(e)
+                    results.append(record)
+                    print(f"{method:10s} {dist:10s} {fname:6s} n={n:<7d} "
+                          f"err={record.get('max_error')}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк методов интерполяции")
+    parser.add_argument("--out", default="interp_benchmark.json", help="файл JSON с результатами")
+    parser.add_argument("--n-max", type=int, default=100000, help="наибольшее число узлов")
+    parser.add_argument("--points", type=int, default=1000, help="размер контрольной сетки")
+    parser.add_argument("--methods", nargs="+", default=list(METHODS), choices=list(METHODS))
+    parser.add_argument("--nodes", nargs="+", default=list(DISTRIBUTIONS), choices=list(DISTRIBUTIONS))
+    parser.add_argument("--functions", nargs="+", default=list(FUNCTIONS), choices=list(FUNCTIONS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    results = run(args.methods, args.nodes, args.functions, args.n_max, args.points, args.seed)
+    report = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "points": args.points,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    with open(args.out, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=2)
+    print(f"Результаты записаны в {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,22 @@
 import numpy as np
 
-def canonical_polynomial(x_eval: float, xs: list, ys: list) -> float:
+from matrix import eval_poly
+from vandermonde import vandermonde_coeffs
+
+def canonical_polynomial(x_eval: float | np.ndarray, xs: list, ys: list) -> float | np.ndarray:
     """
     Вычисление интерполяционного полинома в канонической форме.
     xs — точки X
     ys — точки Y
-    x_eval — точка, в которой нужно вычислить P(x)
+    x_eval — точка или массив точек, в которых нужно вычислить P(x)
     """
 
-    xs = np.array(xs, dtype=float)
-    ys = np.array(ys, dtype=float)
-
-    n = len(xs)
-
-    # Формирование матрицы Вандермонда
-    A = np.vander(xs, N=n, increasing=True)
-
-    # Решение системы A * coeffs = ys
-    coeffs = np.linalg.solve(A, ys)
-
-    # Вычисление значения полинома
-    x_powers = np.array([x_eval ** i for i in range(n)])
-    result = np.dot(coeffs, x_powers)
+    # Решение системы A * coeffs = ys с матрицей Вандермонда A
+    # (алгоритм Бьорка–Перейры, O(n²); для той же таблицы — из кэша)
+    coeffs = vandermonde_coeffs(xs, ys)
 
-    return result
+    # Вычисление значения полинома схемой Горнера (сразу для всех x_eval)
+    return eval_poly(coeffs, x_eval)
 
 
 # Пример использования:
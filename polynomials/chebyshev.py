@@ -0,0 +1,129 @@
+"""
+Интерполяция в базисе многочленов Чебышёва.
+
+f берётся в точках Чебышёва второго рода x_j = cos(jπ/n) (перенесённых
+на [a, b]), коэффициенты разложения P(x) = Σ c_k T_k(x) получаются
+дискретным косинус-преобразованием (DCT-I через FFT) за O(n log n),
+а значение P(x) — рекуррентной схемой Кленшоу за O(n) на точку.
+
+В отличие от мономиального базиса (canon.py, matrix.py, где матрица
+Вандермонда плохо обусловлена уже при n ~ 20) такое представление
+устойчиво при степенях в тысячи. Коэффициенты гладкой функции быстро
+убывают, поэтому хвост ниже заданной точности отбрасывается.
+"""
+
+import numpy as np
+
+
+def chebyshev_points(n: int, a: float = -1.0, b: float = 1.0) -> np.ndarray:
+    """n + 1 точек Чебышёва второго рода на [a, b] (по убыванию, как cos(jπ/n))."""
+    t = np.cos(np.arange(n + 1) * np.pi / n)
+    return 0.5 * (a + b) + 0.5 * (b - a) * t
+
+
+def chebyshev_coeffs(values) -> np.ndarray:
+    """
+    Коэффициенты c_0..c_n по значениям в точках chebyshev_points(n).
+
+    DCT-I значений сводится к FFT чётного продолжения
+    [v_0, ..., v_n, v_{n−1}, ..., v_1] длины 2n.
+    """
+    v = np.asarray(values, dtype=float)
+    n = len(v) - 1
+    if n == 0:
+        return v.copy()
+
+    ext = np.concatenate([v, v[-2:0:-1]])
+    c = np.fft.rfft(ext).real[:n + 1] / n
+    c[0] /= 2
+    c[n] /= 2
+    return c
+
+
+def clenshaw(coeffs, t):
+    """Σ c_k T_k(t) рекуррентной схемой Кленшоу; t — число или массив на [−1, 1]."""
+    t = np.asarray(t, dtype=float)
+    b1 = np.zeros(t.shape)
+    b2 = np.zeros(t.shape)
+    for c in coeffs[:0:-1]:
+        b1, b2 = c + 2 * t * b1 - b2, b1
+    return coeffs[0] + t * b1 - b2
+
+
+def _evaluate(f, x):
+    try:
+        y = np.asarray(f(x), dtype=float)
+    except TypeError:
+        y = np.array([f(xi) for xi in x], dtype=float)
+    return np.broadcast_to(y, x.shape)
+
+
+def _cutoff(coeffs, tol) -> int:
+    """Сколько коэффициентов оставить: хвост ниже tol · max|c_k| отбрасывается."""
+    scale = np.max(np.abs(coeffs))
+    if scale == 0:
+        return 1
+    big = np.flatnonzero(np.abs(coeffs) > tol * scale)
+    return int(big[-1]) + 1
+
+
+class ChebyshevInterpolant:
+    """
+    P(x) = Σ c_k T_k(t), t = (2x − a − b) / (b − a).
+
+    :param f: функция (желательно векторная); можно не задавать и
+              построить интерполянт по готовым значениям (from_values)
+    :param n: степень; если None — подбирается удвоением n, пока хвост
+              коэффициентов не станет меньше tol
+    :param tol: относительная точность для подбора n и усечения
+    :param max_n: наибольшая допустимая степень при подборе
+    """
+
+    def __init__(self, f=None, a=-1.0, b=1.0, n=None, tol=1e-14, max_n=1 << 16):
+        if b <= a:
+            raise ValueError("Нужно a < b.")
+        self.a = float(a)
+        self.b = float(b)
+        self.coeffs = np.zeros(1)
+        if f is None:
+            return
+
+        if n is not None:
+            values = _evaluate(f, chebyshev_points(n, a, b))
+            self.coeffs = self._truncate(chebyshev_coeffs(values), tol)
+            return
+
+        n = 16
+        while True:
+            c = chebyshev_coeffs(_evaluate(f, chebyshev_points(n, a, b)))
+            # разложение сошлось, если отбрасывается хотя бы последняя восьмая часть
+            keep = _cutoff(c, tol)
+            if keep <= n - n // 8:
+                self.coeffs = c[:keep]
+                return
+            if 2 * n > max_n:
+                raise RuntimeError(
+                    f"Чебышёвская интерполяция: не сошлась при степени {n}")
+            n *= 2
+
+    @classmethod
+    def from_values(cls, values, a=-1.0, b=1.0, tol=0.0):
+        """Интерполянт по значениям в точках chebyshev_points(len(values) − 1, a, b)."""
+        obj = cls(None, a, b)
+        obj.coeffs = obj._truncate(chebyshev_coeffs(values), tol)
+        return obj
+
+    @staticmethod
+    def _truncate(c, tol):
+        return c[:_cutoff(c, tol)] if tol > 0 else c
+
+    @property
+    def degree(self) -> int:
+        return len(self.coeffs) - 1
+
+    def __call__(self, x):
+        """P(x) для числа или массива точек."""
+        x = np.asarray(x, dtype=float)
+        t = (2 * x - self.a - self.b) / (self.b - self.a)
+        result = clenshaw(self.coeffs, t)
+        return float(result) if result.ndim == 0 else result
@@ -1,22 +1,36 @@
-import os
-import tempfile
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 
-def plot_graph(xs, ys, title="Graph") -> str:
+def clear_graph(figure: Figure, text="График появится после расчёта"):
+    """Пустые оси с подсказкой вместо графика."""
+    figure.clear()
+    ax = figure.add_subplot(111)
+    ax.text(0.5, 0.5, text, ha="center", va="center", color="#7f8c8d",
+            transform=ax.transAxes)
+    ax.set_axis_off()
+
+
+def plot_graph(figure: Figure, xs, ys, title="Graph", curve=None):
     """
-    Строит график по массивам xs и ys и сохраняет его в PNG-файл.
+    Строит график на фигуре matplotlib прямо в памяти (без файлов).
+    Фигура живёт в окне на постоянном FigureCanvas; перерисовать холст
+    (canvas.draw_idle()) должен вызывающий.
 
+    :param figure: фигура, на которой рисовать (очищается)
     :param xs: список/массив значений X
     :param ys: список/массив значений Y
     :param title: заголовок графика
-    :return: полный путь к сохранённому изображению
+    :param curve: (x, P(x)) — плотная кривая полинома; если не задана,
+                  узлы просто соединяются ломаной
     """
-    # создаём фигуру
-    fig, ax = plt.subplots()
+    figure.clear()
+    ax = figure.add_subplot(111)
 
     # основная линия (интерполяционный полином)
-    ax.plot(xs, ys, linewidth=1.8, label="P(x)")
+    if curve is not None:
+        ax.plot(curve[0], curve[1], linewidth=1.8, label="P(x)")
+    else:
+        ax.plot(xs, ys, linewidth=1.8, label="P(x)")
 
     # маркеры исходных точек
     ax.scatter(xs, ys, marker="s", label="узлы")
@@ -27,11 +41,3 @@ def plot_graph(xs, ys, title="Graph") -> str:
     ax.set_title(title)
     ax.grid(True)
     ax.legend()
-
-    # сохраняем во временный файл
-    tmp_dir = tempfile.gettempdir()
-    file_path = os.path.join(tmp_dir, "interp_graph.png")
-    fig.savefig(file_path, dpi=150, bbox_inches="tight")
-    plt.close(fig)
-
-    return file_path
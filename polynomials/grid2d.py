@@ -0,0 +1,159 @@
+"""
+Интерполяция функции двух переменных по прямоугольной сетке.
+
+Таблица: узлы gx (по x), gy (по y) и значения F[i, j] = f(gx[i], gy[j]).
+Для каждой ячейки [gx_i, gx_{i+1}] × [gy_j, gy_{j+1}] заранее считается
+многочлен в локальных координатах u, v ∈ [0, 1]:
+    P(u, v) = Σ a_pq u^p v^q,
+и коэффициенты всех ячеек лежат в одном плоском массиве. Вычисление —
+поиск ячейки (searchsorted по каждой оси) и схема Горнера, векторно
+для массивов точек; состояние сохраняется и отображается из файла
+как у любого Interpolant.
+
+Методы:
+    "bilinear" — 2×2 коэффициента на ячейку;
+    "bicubic"  — эрмитова кубика по f, f_x, f_y, f_xy, производные —
+                 центральными разностями (np.gradient);
+    "spline"   — тензорный кубический сплайн: та же эрмитова форма, но
+                 производные взяты у одномерных сплайнов по строкам и
+                 столбцам, поэтому поверхность гладкая (C²) по каждой оси.
+"""
+
+import numpy as np
+
+from interpolants import Interpolant
+from spline import CubicSpline
+
+# кубический эрмитов базис на [0, 1]: коэффициенты по (f0, f1, f'0, f'1)
+_HERMITE = np.array([
+    [1.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, 1.0, 0.0],
+    [-3.0, 3.0, -2.0, -1.0],
+    [2.0, -2.0, 1.0, 1.0],
+])
+
+
+def _spline_slopes(t, F):
+    """Производные натуральных сплайнов вдоль оси 0 для каждого столбца F."""
+    d = np.empty_like(F)
+    for j in range(F.shape[1]):
+        d[:, j] = CubicSpline(t, F[:, j]).derivative(t)
+    return d
+
+
+def _bilinear(F):
+    f00, f10 = F[:-1, :-1], F[1:, :-1]
+    f01, f11 = F[:-1, 1:], F[1:, 1:]
+    a = np.empty(f00.shape + (2, 2))
+    a[..., 0, 0] = f00
+    a[..., 0, 1] = f01 - f00
+    a[..., 1, 0] = f10 - f00
+    a[..., 1, 1] = f11 - f10 - f01 + f00
+    return a
+
+
+def _hermite(F, Fx, Fy, Fxy, hx, hy):
+    # производные приводим к локальным координатам ячейки
+    hx = hx[:, None]
+    hy = hy[None, :]
+
+    def corners(G):
+        return G[:-1, :-1], G[:-1, 1:], G[1:, :-1], G[1:, 1:]
+
+    f00, f01, f10, f11 = corners(F)
+    x00, x01, x10, x11 = (g * hx for g in corners(Fx))
+    y00, y01, y10, y11 = (g * hy for g in corners(Fy))
+    z00, z01, z10, z11 = (g * hx * hy for g in corners(Fxy))
+
+    # K[p, q]: строки — (f(0,·), f(1,·), f_u(0,·), f_u(1,·)), столбцы — то же по v
+    K = np.stack([
+        np.stack([f00, f01, y00, y01], axis=-1),
+        np.stack([f10, f11, y10, y11], axis=-1),
+        np.stack([x00, x01, z00, z01], axis=-1),
+        np.stack([x10, x11, z10, z11], axis=-1),
+    ], axis=-2)
+    return np.einsum("pk,...kl,ql->...pq", _HERMITE, K, _HERMITE)
+
+
+class GridInterpolant(Interpolant):
+    """
+    Интерполяция по прямоугольной сетке.
+
+    :param gx, gy: возрастающие узлы по осям (не обязательно равномерные)
+    :param values: массив значений формы (len(gx), len(gy))
+    :param method: "bilinear", "bicubic" или "spline"
+    """
+
+    __slots__ = ("gx", "gy", "coeffs")
+
+    def __init__(self, gx, gy, values, method="bicubic"):
+        gx = np.ascontiguousarray(gx, dtype=float)
+        gy = np.ascontiguousarray(gy, dtype=float)
+        F = np.asarray(values, dtype=float)
+        if F.shape != (len(gx), len(gy)):
+            raise ValueError("Форма values должна быть (len(gx), len(gy)).")
+        if len(gx) < 2 or len(gy) < 2:
+            raise ValueError("Нужно минимум по два узла на каждой оси.")
+        if np.any(np.diff(gx) <= 0) or np.any(np.diff(gy) <= 0):
+            raise ValueError("Узлы сетки должны строго возрастать.")
+
+        hx, hy = np.diff(gx), np.diff(gy)
+        if method == "bilinear":
+            a = _bilinear(F)
+        elif method == "bicubic":
+            Fx = np.gradient(F, gx, axis=0)
+            Fy = np.gradient(F, gy, axis=1)
+            Fxy = np.gradient(Fx, gy, axis=1)
+            a = _hermite(F, Fx, Fy, Fxy, hx, hy)
+        elif method == "spline":
+            Fx = _spline_slopes(gx, F)
+            Fy = _spline_slopes(gy, F.T).T
+            Fxy = _spline_slopes(gy, Fx.T).T
+            a = _hermite(F, Fx, Fy, Fxy, hx, hy)
+        else:
+            raise ValueError(f"Неизвестный метод: {method}")
+
+        self.gx = gx
+        self.gy = gy
+        # плоский массив: ячейка (i, j) занимает p² чисел с номера (i·(ny−1) + j)·p²
+        self.coeffs = np.ascontiguousarray(a).ravel()
+
+    @property
+    def order(self) -> int:
+        """Число коэффициентов по каждой оси в ячейке (2 или 4)."""
+        cells = (len(self.gx) - 1) * (len(self.gy) - 1)
+        return int(round(np.sqrt(self.coeffs.size // cells)))
+
+    @staticmethod
+    def _locate(g, t):
+        i = np.clip(np.searchsorted(g, t, side="right") - 1, 0, len(g) - 2)
+        return i, (t - g[i]) / (g[i + 1] - g[i])
+
+    def __call__(self, x, y, chunk=1 << 18):
+        """Значения в точках (x, y); x и y — числа или массивы одной формы."""
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        shape = x.shape
+        x, y = x.ravel(), y.ravel()
+
+        p = self.order
+        table = self.coeffs.reshape(-1, p, p)
+        ny = len(self.gy) - 1
+        result = np.empty(x.size)
+
+        for s in range(0, x.size, chunk):
+            i, u = self._locate(self.gx, x[s:s + chunk])
+            j, v = self._locate(self.gy, y[s:s + chunk])
+            a = table[i * ny + j]
+
+            # Горнер по v для каждой степени u, затем по u
+            r = a[:, :, p - 1]
+            for q in range(p - 2, -1, -1):
+                r = a[:, :, q] + v[:, None] * r
+            val = r[:, p - 1]
+            for k in range(p - 2, -1, -1):
+                val = r[:, k] + u * val
+            result[s:s + chunk] = val
+
+        if not shape:
+            return float(result[0])
+        return result.reshape(shape)
@@ -0,0 +1,163 @@
+"""
+Интерполянты как объекты с сохранённым состоянием.
+
+Функции lagrange, newton_interpolation, canonical_polynomial при каждом
+вызове начинают с исходных списков xs, ys. Классы ниже считают всё, что
+зависит только от таблицы (веса, разности, коэффициенты, моменты), один
+раз при построении и хранят результат в непрерывных массивах float64
+(целые параметры вроде размера окна — обычными числами).
+
+Состояние сохраняется в .npz (save) и читается обратно (Interpolant.load)
+без повторного построения. С mmap=True массивы не читаются в память, а
+отображаются из файла: одну таблицу, подготовленную заранее, могут
+одновременно использовать много процессов.
+"""
+
+import abc
+import importlib
+import struct
+import zipfile
+
+import numpy as np
+
+from lagrange import barycentric, barycentric_weights
+from matrix import eval_poly
+from vandermonde import vandermonde_coeffs
+
+
+def _array(v) -> np.ndarray:
+    return np.ascontiguousarray(v, dtype=np.float64)
+
+
+def _npz_memmap(path) -> dict:
+    """
+    Массивы из несжатого .npz (np.savez) как np.memmap.
+
+    Каждый массив лежит в zip-архиве как отдельный .npy без сжатия:
+    смещение данных = начало локального заголовка zip + его длина +
+    длина заголовка .npy.
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as fh:
+        for info in zf.infolist():
+            name = info.filename[:-len(".npy")]
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError("mmap возможен только для несжатого .npz (np.savez).")
+
+            fh.seek(info.header_offset)
+            local = fh.read(30)
+            name_len, extra_len = struct.unpack("<HH", local[26:30])
+            fh.seek(info.header_offset + 30 + name_len + extra_len)
+
+            version = np.lib.format.read_magic(fh)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(fh)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(fh)
+
+            if shape == () or dtype.hasobject:
+                # скаляры (например, тип интерполянта) проще прочитать целиком
+                with zf.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+                continue
+
+            arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=fh.tell(),
+                                     shape=shape, order="F" if fortran else "C")
+    return arrays
+
+
+class Interpolant(abc.ABC):
+    """
+    Базовый класс. Состояние подкласса — __slots__ всех классов его
+    иерархии (массивы float64 и скалярные параметры); по ним работают
+    save / load.
+    """
+
+    __slots__ = ()
+    _kinds = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Interpolant._kinds[cls.__name__] = cls
+
+    @abc.abstractmethod
+    def __call__(self, x):
+        """Значение интерполянта в точке или массиве точек."""
+
+    @classmethod
+    def _fields(cls):
+        return tuple(name for klass in reversed(cls.__mro__)
+                     for name in klass.__dict__.get("__slots__", ()))
+
+    def state(self) -> dict:
+        return {name: getattr(self, name) for name in self._fields()}
+
+    @classmethod
+    def from_state(cls, **arrays):
+        """Объект по готовым массивам состояния — без повторного построения."""
+        obj = cls.__new__(cls)
+        for name in cls._fields():
+            setattr(obj, name, arrays[name])
+        return obj
+
+    def save(self, path):
+        """
+        Сохраняет состояние в несжатый .npz (пригоден для mmap).
+        Вместе с массивами записываются имя класса и его модуля, чтобы
+        load нашёл класс и в новом процессе, где модуль ещё не импортирован.
+        """
+        cls = type(self)
+        np.savez(path, kind=np.array(cls.__name__), module=np.array(cls.__module__),
+                 **self.state())
+
+    @staticmethod
+    def load(path, mmap=False) -> "Interpolant":
+        """
+        Загружает интерполянт, сохранённый через save.
+        mmap=True — массивы отображаются из файла, а не читаются в память.
+        """
+        if mmap:
+            arrays = _npz_memmap(path)
+        else:
+            with np.load(path) as data:
+                arrays = {name: data[name] for name in data.files}
+
+        kind = str(arrays.pop("kind"))
+        module = arrays.pop("module", None)
+        if module is not None and kind not in Interpolant._kinds:
+            # импорт модуля регистрирует его классы (см. __init_subclass__)
+            importlib.import_module(str(module))
+
+        # скалярные параметры savez пишет 0-мерными массивами — возвращаем числа
+        arrays = {name: a.item() if a.ndim == 0 else a for name, a in arrays.items()}
+
+        cls = Interpolant._kinds.get(kind)
+        if cls is None:
+            raise ValueError(f"Неизвестный тип интерполянта: {kind}")
+        return cls.from_state(**arrays)
+
+
+class BarycentricInterpolant(Interpolant):
+    """Полином Лагранжа в барицентрической форме: узлы, значения, веса."""
+
+    __slots__ = ("xs", "ys", "w")
+
+    def __init__(self, xs, ys, nodes="auto"):
+        self.xs = _array(xs)
+        self.ys = _array(ys)
+        self.w = _array(barycentric_weights(self.xs, nodes))
+
+    def __call__(self, x):
+        return barycentric(x, self.xs, self.ys, self.w)
+
+
+class CanonicalPolynomial(Interpolant):
+    """Полином в каноническом виде: коэффициенты по возрастанию степеней."""
+
+    __slots__ = ("coeffs",)
+
+    def __init__(self, xs, ys):
+        self.coeffs = _array(vandermonde_coeffs(xs, ys))
+
+    def __call__(self, x):
+        return eval_poly(self.coeffs, x)
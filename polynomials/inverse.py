@@ -0,0 +1,117 @@
+"""
+Обратная интерполяция: x по заданному y для табличной функции.
+
+Таблица (xs, ys) заменяется кубическим сплайном S(x) и один раз делится
+на участки монотонности (по значениям в узлах). На каждом участке:
+    1) двоичный поиск по ys участка находит ячейку [x_k, x_{k+1}], где
+       лежит искомый y, — там S(x) = y имеет корень, и он отделён;
+    2) корень уточняется методом Ньютона по S(x) с защитой: шаг, выходящий
+       за текущую вилку, заменяется делением пополам.
+Всё векторно по массиву целевых значений y.
+"""
+
+import numpy as np
+
+from spline import CubicSpline
+
+
+class InverseSpline(CubicSpline):
+    """
+    Сплайн с индексом участков монотонности для решения S(x) = y.
+
+    seg — номера узлов, с которых начинаются участки монотонности
+    (последний элемент — номер последнего узла). Сам S(x) доступен как
+    у обычного CubicSpline.
+    """
+
+    __slots__ = ("seg",)
+
+    def __init__(self, xs, ys, bc="natural", slopes=(0.0, 0.0)):
+        super().__init__(xs, ys, bc, slopes)
+
+        # границы участков — узлы, где меняется знак разности ys
+        s = np.sign(np.diff(self.y))
+        breaks = np.flatnonzero(s[1:] != s[:-1]) + 1
+        self.seg = np.concatenate([[0], breaks, [len(self.y) - 1]]).astype(np.int64)
+
+    def roots(self, y, tol=1e-12, max_iter=50):
+        """
+        Все решения S(x) = y, по одному на участок монотонности.
+
+        :param y: число или массив целевых значений
+        :return: массив формы (len(y), число участков); NaN — на участке
+                 значения y нет
+        """
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        out = np.full((y.size, len(self.seg) - 1), np.nan)
+
+        for s in range(len(self.seg) - 1):
+            lo, hi = int(self.seg[s]), int(self.seg[s + 1])
+            ys = self.y[lo:hi + 1]
+            if ys[-1] == ys[0]:
+                continue                        # горизонтальный участок
+            rising = ys[-1] > ys[0]
+            asc = ys if rising else ys[::-1]
+
+            inside = np.flatnonzero((y >= asc[0]) & (y <= asc[-1]))
+            if inside.size == 0:
+                continue
+            target = y[inside]
+
+            k = np.clip(np.searchsorted(asc, target) - 1, 0, hi - lo - 1)
+            if not rising:
+                k = hi - lo - 1 - k
+            k += lo
+            out[inside, s] = self._solve_in_cells(k, target, tol, max_iter)
+
+        return out
+
+    def _solve_in_cells(self, k, target, tol, max_iter):
+        a, b = self.x[k], self.x[k + 1]
+        ya, yb = self.y[k], self.y[k + 1]
+        direction = np.sign(yb - ya)
+
+        # старт — линейная интерполяция внутри ячейки
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x = np.where(yb != ya, a + (target - ya) * (b - a) / (yb - ya), a)
+        # точность: доля ширины ячейки, но не мельче нескольких ulp
+        atol = tol * (b - a) + 4 * np.finfo(float).eps * np.maximum(np.abs(a), np.abs(b))
+
+        # итерируем только ещё не сошедшиеся точки
+        active = np.arange(x.size)
+        for _ in range(max_iter):
+            xa, ta = x[active], target[active]
+            g = self(xa) - ta
+            d = self.derivative(xa)
+
+            # точное попадание в корень: точку замораживаем как есть
+            hit = g == 0
+
+            # сужаем вилку [a, b]: слева от корня знак g противоположен direction
+            left = direction[active] * g < 0
+            right = ~left & ~hit
+            a[active] = np.where(left, xa, a[active])
+            b[active] = np.where(right, xa, b[active])
+
+            with np.errstate(invalid="ignore", divide="ignore"):
+                xn = xa - g / d
+            bad = ~np.isfinite(xn) | (xn <= a[active]) | (xn >= b[active])
+            xn = np.where(bad, 0.5 * (a[active] + b[active]), xn)
+            xn = np.where(hit, xa, xn)
+
+            x[active] = xn
+            active = active[(np.abs(xn - xa) > atol[active]) & ~hit]
+            if active.size == 0:
+                break
+
+        return x
+
+    def inverse(self, y, tol=1e-12, max_iter=50):
+        """
+        Наименьший x с S(x) = y для каждого y (NaN, если y вне значений таблицы).
+        Для монотонной таблицы это просто обратная функция.
+        """
+        r = self.roots(y, tol, max_iter)
+        first = np.argmax(~np.isnan(r), axis=1)
+        x = r[np.arange(r.shape[0]), first]
+        return float(x[0]) if np.ndim(y) == 0 else x.reshape(np.shape(y))
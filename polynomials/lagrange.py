@@ -1,20 +1,143 @@
-def lagrange(x_eval: float, xs: list, ys: list) -> float:
+import numpy as np
+
+
+def lagrange(x_eval: float | np.ndarray, xs: list, ys: list) -> float | np.ndarray:
     """
     Интерполяция полиномом Лагранжа.
     xs, ys — списки узлов (одной длины)
-    x_eval — точка, в которой нужно найти значение P(x)
+    x_eval — точка или массив точек, в которых нужно найти значение P(x)
+
+    Считается в барицентрической форме (см. ниже): O(n²) на веса и O(n)
+    на каждую точку вместо O(n²) на точку в исходной записи
+    Σ y_i Π_{j≠i} (x − x_j)/(x_i − x_j).
     """
-    n = len(xs)
-    result = 0.0
+    return barycentric(x_eval, xs, ys)
+
+
+# ==========================
+#   Барицентрическая форма
+# ==========================
+#
+#            Σ w_j y_j / (x − x_j)
+#   P(x) = ─────────────────────────,   w_j = 1 / Π_{k≠j} (x_j − x_k)
+#            Σ w_j / (x − x_j)
+#
+# Веса зависят только от узлов: считаются один раз, после чего каждое
+# значение P(x) стоит O(n) операций (и сразу для массива точек x).
+
+
+def _equispaced(xs: np.ndarray) -> bool:
+    h = np.diff(np.sort(xs))
+    return bool(np.allclose(h, h[0], rtol=1e-10, atol=0.0))
+
+
+def _chebyshev(xs: np.ndarray) -> bool:
+    """Узлы — точки Чебышёва второго рода x_j = c − r·cos(jπ/n) на [a, b]."""
+    s = np.sort(xs)
+    n = len(s) - 1
+    c, r = 0.5 * (s[0] + s[-1]), 0.5 * (s[-1] - s[0])
+    ref = c - r * np.cos(np.arange(n + 1) * np.pi / n)
+    return bool(np.allclose(s, ref, rtol=0.0, atol=1e-12 * max(r, 1.0)))
+
+
+def barycentric_weights(xs, nodes: str = "auto", chunk: int = 1 << 20) -> np.ndarray:
+    """
+    Барицентрические веса для узлов xs (с точностью до общего множителя).
+
+    :param nodes: "equispaced" — равноотстоящие узлы, O(n):
+                      w_j = (−1)^j C(n, j);
+                  "chebyshev" — точки Чебышёва второго рода, O(n):
+                      w_j = (−1)^j, на концах 1/2;
+                  "general" — произвольные узлы, O(n²) по времени
+                      и O(n) по памяти;
+                  "auto" — выбрать по самим узлам.
+    :param chunk: сколько элементов матрицы (x_i − x_j) обрабатывать за раз
+    """
+    xs = np.asarray(xs, dtype=float)
+    n = len(xs) - 1
+    if n < 1:
+        return np.ones(len(xs))
+    if len(np.unique(xs)) != len(xs):
+        raise ValueError("Узлы интерполяции должны быть различными.")
+
+    if nodes == "auto":
+        if _equispaced(xs):
+            nodes = "equispaced"
+        elif _chebyshev(xs):
+            nodes = "chebyshev"
+        else:
+            nodes = "general"
+
+    if nodes == "general":
+        # произведение считаем как сумму логарифмов модулей и отдельно знак,
+        # затем делим на наибольший вес — иначе при больших n переполнение;
+        # матрица разностей строится полосами по нескольку строк
+        log_w = np.empty(n + 1)
+        negative = np.empty(n + 1, dtype=np.int64)
+        step = max(1, chunk // len(xs))
+        for start in range(0, n + 1, step):
+            d = xs[start:start + step, None] - xs[None, :]
+            rows = np.arange(d.shape[0])
+            d[rows, start + rows] = 1.0
+            log_w[start:start + step] = -np.sum(np.log(np.abs(d)), axis=1)
+            negative[start:start + step] = np.sum(d < 0, axis=1)
+        sign = np.where(negative % 2 == 0, 1.0, -1.0)
+        return sign * np.exp(log_w - log_w.max())
+
+    order = np.argsort(xs)
+    j = np.arange(n + 1)
+    sign = np.where(j % 2 == 0, 1.0, -1.0)
+
+    if nodes == "equispaced":
+        # log C(n, j) накопленной суммой: C(n, j+1) = C(n, j)·(n − j)/(j + 1);
+        # делим на наибольший, чтобы при больших n не было переполнения
+        log_c = np.concatenate([[0.0], np.cumsum(np.log((n - j[:-1]) / (j[:-1] + 1)))])
+        w_sorted = sign * np.exp(log_c - log_c.max())
+    elif nodes == "chebyshev":
+        w_sorted = sign
+        w_sorted[[0, -1]] *= 0.5
+    else:
+        raise ValueError(f"Неизвестный тип узлов: {nodes}")
+
+    # формулы записаны для возрастающих узлов — возвращаем в исходный порядок
+    w = np.empty(n + 1)
+    w[order] = w_sorted
+    return w
+
+
+def barycentric(x_eval, xs, ys, w=None, chunk: int = 1 << 20):
+    """
+    Значение интерполяционного полинома Лагранжа в барицентрической форме.
+
+    :param x_eval: точка или массив точек
+    :param w: веса из barycentric_weights (если None — считаются здесь)
+    :param chunk: сколько элементов матрицы (x − x_j) обрабатывать за раз
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if w is None:
+        w = barycentric_weights(xs)
+
+    x = np.asarray(x_eval, dtype=float)
+    scalar = x.ndim == 0
+    x = x.ravel()
+    result = np.empty(x.size)
 
-    for i in range(n):
-        term = ys[i]
-        for j in range(n):
-            if j != i:
-                term *= (x_eval - xs[j]) / (xs[i] - xs[j])
-        result += term
+    step = max(1, chunk // len(xs))
+    for start in range(0, x.size, step):
+        xb = x[start:start + step]
+        diff = xb[:, None] - xs[None, :]
+        exact = diff == 0
+        diff[exact] = 1.0                   # в узле значение берём из таблицы
+        t = w / diff
+        p = (t @ ys) / t.sum(axis=1)
+        rows, cols = np.nonzero(exact)
+        p[rows] = ys[cols]
+        result[start:start + step] = p
 
-    return result
+    if scalar:
+        return float(result[0])
+    return result.reshape(np.shape(x_eval))
 
 
 # пример использования
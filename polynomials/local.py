@@ -0,0 +1,75 @@
+"""
+Локальная интерполяция по окну из k соседних узлов.
+
+При 10⁶ узлов глобальный полином бесполезен: O(n²) на точку и
+осцилляции Рунге между узлами. Здесь для каждой точки x двоичным поиском
+(searchsorted) находится окно из k узлов вокруг x, и значение берётся
+у полинома Ньютона степени k − 1 по этому окну: O(log n + k²) на точку.
+
+Все точки обрабатываются векторно, кусками по chunk штук, так что
+память не растёт с числом точек запроса.
+"""
+
+import numpy as np
+
+from interpolants import Interpolant
+
+
+class LocalInterpolant(Interpolant):
+    """
+    Кусочно-полиномиальная интерполяция степени k − 1 по скользящему окну.
+
+    :param xs, ys: таблица (узлы сортируются)
+    :param k: число узлов в окне (k = 4 — локальная кубическая интерполяция)
+    """
+
+    __slots__ = ("xs", "ys", "k")
+
+    def __init__(self, xs, ys, k=4):
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if xs.shape != ys.shape or xs.ndim != 1:
+            raise ValueError("xs и ys должны быть одномерными и одной длины.")
+        if not 1 <= k <= len(xs):
+            raise ValueError("Размер окна k должен быть от 1 до числа узлов.")
+
+        order = np.argsort(xs, kind="stable")
+        self.xs = np.ascontiguousarray(xs[order])
+        self.ys = np.ascontiguousarray(ys[order])
+        if np.any(np.diff(self.xs) == 0):
+            raise ValueError("Узлы интерполяции должны быть различными.")
+        self.k = int(k)
+
+    def _window(self, x):
+        """Номер первого узла окна для каждой точки x."""
+        k = self.k
+        i = np.searchsorted(self.xs, x)
+        return np.clip(i - k // 2, 0, len(self.xs) - k)
+
+    def __call__(self, x, chunk=1 << 16):
+        """Значение в точке или массиве точек."""
+        x_in = np.asarray(x, dtype=float)
+        x = x_in.ravel()
+        k = self.k
+        offsets = np.arange(k)
+        result = np.empty(x.size)
+
+        for s in range(0, x.size, chunk):
+            xb = x[s:s + chunk]
+            idx = self._window(xb)[:, None] + offsets
+            X = self.xs[idx]
+            c = self.ys[idx]
+
+            # разделённые разности по окну: c[:, j] = f[x_0, ..., x_j]
+            for j in range(1, k):
+                c[:, j:] = (c[:, j:] - c[:, j - 1:k - 1]) / (X[:, j:] - X[:, :k - j])
+
+            # вложенное умножение
+            p = c[:, k - 1].copy()
+            for j in range(k - 2, -1, -1):
+                p = c[:, j] + (xb - X[:, j]) * p
+            result[s:s + chunk] = p
+
+        if x_in.ndim == 0:
+            return float(result[0])
+        return result.reshape(x_in.shape)
@@ -1,10 +1,9 @@
 # polynomials/main.py
 
 import sys
-from pathlib import Path
 
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap, QFont
+from PySide6.QtGui import QFont
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -21,11 +20,16 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 
+import numpy as np
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
 # === импорт твоих методов интерполяции ===
-from lagrange import lagrange                     # def lagrange(x_eval, xs, ys) -> float
-from newton import newton_interpolation           # def newton_interpolation(x, xs, ys) -> float
-from canon import canonical_polynomial            # def canonical_polynomial(x_eval, xs, ys) -> float
-from graph import plot_graph                      # def plot_graph(xs, ys, title="Graph") -> str
+from lagrange import barycentric, barycentric_weights
+from newton import NewtonInterpolant             # P = NewtonInterpolant(xs, ys); P(x)
+from canon import canonical_polynomial            # def canonical_polynomial(x_eval, xs, ys) -> float | np.ndarray
+from spline import CubicSpline                   # S = CubicSpline(xs, ys); S(x)
+from graph import plot_graph, clear_graph         # рисуют на matplotlib Figure
 
 
 APP_STYLES = """
@@ -95,12 +99,6 @@ QPushButton[secondary="true"]:pressed {
     background-color: #d4e8ff;
 }
 
-#graphLabel {
-    background-color: #ffffff;
-    border: 1px dashed #c4ccdd;
-    border-radius: 6px;
-}
-
 #legendLabel {
     color: #7f8c8d;
     font-style: italic;
@@ -216,8 +214,10 @@ class PolyWindow(QMainWindow):
         self.le_res_lagrange = QLineEdit()
         self.le_res_newton = QLineEdit()
         self.le_res_canon = QLineEdit()
+        self.le_res_spline = QLineEdit()
 
-        for le in (self.le_res_lagrange, self.le_res_newton, self.le_res_canon):
+        for le in (self.le_res_lagrange, self.le_res_newton, self.le_res_canon,
+                   self.le_res_spline):
             le.setReadOnly(True)
 
         rg_layout.addWidget(QLabel("Лагранжа:"), 0, 0)
@@ -229,17 +229,21 @@ class PolyWindow(QMainWindow):
         rg_layout.addWidget(QLabel("Канонический:"), 2, 0)
         rg_layout.addWidget(self.le_res_canon, 2, 1)
 
+        rg_layout.addWidget(QLabel("Сплайн:"), 3, 0)
+        rg_layout.addWidget(self.le_res_spline, 3, 1)
+
         right_layout.addWidget(result_group)
 
         # --- График ---
         graph_group = QGroupBox("График P(x) и узлов")
         gg_layout = QVBoxLayout(graph_group)
 
-        self.graph_label = QLabel("График появится после расчёта")
-        self.graph_label.setObjectName("graphLabel")
-        self.graph_label.setAlignment(Qt.AlignCenter)
-        self.graph_label.setMinimumHeight(260)
-        gg_layout.addWidget(self.graph_label)
+        # холст создаётся один раз и перерисовывается на месте
+        self.figure = Figure(figsize=(5, 3.5), tight_layout=True)
+        self.canvas = FigureCanvas(self.figure)
+        self.canvas.setMinimumHeight(260)
+        gg_layout.addWidget(self.canvas)
+        clear_graph(self.figure)
 
         legend = QLabel("Синяя линия — P(x), квадратные маркеры — табличные точки")
         legend.setAlignment(Qt.AlignCenter)
@@ -255,6 +259,11 @@ class PolyWindow(QMainWindow):
         self.btn_clear.clicked.connect(self.on_clear_all)
         self.btn_calc.clicked.connect(self.on_calculate)
 
+        # барицентрические веса последнего набора узлов: (узлы, веса)
+        self._weights = None
+        # полином Ньютона по текущим узлам, пополняется при добавлении точки
+        self.newton = NewtonInterpolant()
+
         # применяем стили уже после создания всех виджетов/свойств
         self.setStyleSheet(APP_STYLES)
 
@@ -285,6 +294,13 @@ class PolyWindow(QMainWindow):
             ys.append(float(y_text))
         return xs, ys
 
+    def _weights_for(self, xs):
+        """Веса для узлов xs; пересчитываются, только если узлы изменились."""
+        key = tuple(xs)
+        if self._weights is None or self._weights[0] != key:
+            self._weights = (key, barycentric_weights(xs))
+        return self._weights[1]
+
     # ------ ОБРАБОТЧИКИ КНОПОК ------
 
     def on_add_point(self):
@@ -295,6 +311,12 @@ class PolyWindow(QMainWindow):
             QMessageBox.warning(self, "Ошибка", "Введите корректные числа x и y.")
             return
 
+        try:
+            self.newton.add_node(x, y)
+        except ValueError as e:
+            QMessageBox.warning(self, "Ошибка", str(e))
+            return
+
         self.list_x.addItem(QListWidgetItem(str(x)))
         self.list_y.addItem(QListWidgetItem(str(y)))
         self.le_x.clear()
@@ -311,6 +333,7 @@ class PolyWindow(QMainWindow):
         for x, y in zip(xs, ys):
             self.list_x.addItem(QListWidgetItem(str(x)))
             self.list_y.addItem(QListWidgetItem(str(y)))
+        self.newton = NewtonInterpolant(xs, ys)
 
     def on_delete_selected(self):
         row = self.list_x.currentRow()
@@ -321,14 +344,20 @@ class PolyWindow(QMainWindow):
         self.list_x.takeItem(row)
         self.list_y.takeItem(row)
 
+        # удаление узла из середины разностей не обратить — строим заново
+        xs, ys = self._read_lists()
+        self.newton = NewtonInterpolant(xs, ys)
+
     def on_clear_all(self):
         self.list_x.clear()
         self.list_y.clear()
+        self.newton = NewtonInterpolant()
         self.le_res_lagrange.clear()
         self.le_res_newton.clear()
         self.le_res_canon.clear()
-        self.graph_label.setText("График появится после расчёта")
-        self.graph_label.setPixmap(QPixmap())
+        self.le_res_spline.clear()
+        clear_graph(self.figure)
+        self.canvas.draw_idle()
 
     def on_calculate(self):
         # читаем x*
@@ -350,9 +379,13 @@ class PolyWindow(QMainWindow):
 
         # --- вычисляем полиномы ---
         try:
-            val_lagr = lagrange(x_eval, xs, ys)
-            val_newt = newton_interpolation(x_eval, xs, ys)
+            weights = self._weights_for(xs)
+            val_lagr = barycentric(x_eval, xs, ys, weights)
+            if not np.array_equal(self.newton.xs, xs):
+                self.newton = NewtonInterpolant(xs, ys)
+            val_newt = self.newton(x_eval)
             val_canon = canonical_polynomial(x_eval, xs, ys)
+            val_spline = CubicSpline(xs, ys)(x_eval)
         except Exception as e:
             QMessageBox.critical(self, "Ошибка вычислений", str(e))
             return
@@ -360,25 +393,21 @@ class PolyWindow(QMainWindow):
         self.le_res_lagrange.setText(f"{val_lagr:.6f}")
         self.le_res_newton.setText(f"{val_newt:.6f}")
         self.le_res_canon.setText(f"{val_canon:.6f}")
+        self.le_res_spline.setText(f"{val_spline:.6f}")
 
         # --- строим график ---
         try:
-            img_path = plot_graph(xs, ys, title="P(x) и табличные точки")
+            # плотная кривая P(x) одним вызовом на тех же весах
+            x_min, x_max = min(xs + [x_eval]), max(xs + [x_eval])
+            x_dense = np.linspace(x_min, x_max, 400)
+            y_dense = barycentric(x_dense, xs, ys, weights)
+            plot_graph(self.figure, xs, ys, title="P(x) и табличные точки",
+                       curve=(x_dense, y_dense))
         except Exception as e:
             QMessageBox.critical(self, "Ошибка графика", str(e))
             return
 
-        if img_path and Path(img_path).exists():
-            pixmap = QPixmap(img_path)
-            scaled = pixmap.scaled(
-                self.graph_label.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
-            self.graph_label.setPixmap(scaled)
-            self.graph_label.setText("")
-        else:
-            QMessageBox.warning(self, "График", "Не удалось загрузить изображение графика.")
+        self.canvas.draw_idle()
 
 
 def main():
@@ -1,30 +1,34 @@
 import numpy as np
 
+from vandermonde import vandermonde_coeffs
+
 def matrix_method(xs: list, ys: list):
     """
     Решение системы A*p = Y матричным способом.
     Возвращает коэффициенты полинома.
     """
-    xs = np.array(xs, dtype=float)
-    ys = np.array(ys, dtype=float)
-
-    n = len(xs)
+    # p = A^{-1} * Y для матрицы Вандермонда A: саму A^{-1} не строим,
+    # а решаем систему за O(n²) алгоритмом Бьорка–Перейры
+    coeffs = vandermonde_coeffs(xs, ys)
 
-    # Матрица Вандермонда A
-    A = np.vander(xs, N=n, increasing=True)
+    return coeffs.copy()
 
-    # Обратная матрица A^{-1}
-    A_inv = np.linalg.inv(A)
 
-    # Умножение A^{-1} * Y
-    coeffs = np.dot(A_inv, ys)
-
-    return coeffs
+def eval_poly(coeffs, x):
+    """
+    Вычисление полинома по найденным коэффициентам схемой Горнера:
+    P(x) = c0 + x(c1 + x(c2 + ...)).
+    coeffs — коэффициенты по возрастанию степеней,
+    x — число или массив точек (тогда и результат — массив).
+    """
+    coeffs = np.asarray(coeffs, dtype=float)
+    x = np.asarray(x, dtype=float)
 
+    result = np.full(x.shape, coeffs[-1])
+    for c in coeffs[-2::-1]:
+        result = result * x + c
 
-def eval_poly(coeffs, x):
-    """Вычисление полинома по найденным коэффициентам."""
-    return sum(coeffs[i] * x**i for i in range(len(coeffs)))
+    return float(result) if result.ndim == 0 else result
 
 
 # Пример
@@ -1,34 +1,84 @@
-def newton_interpolation(x, xs, ys):
+import numpy as np
+
+from interpolants import Interpolant
+
+
+class NewtonInterpolant(Interpolant):
     """
-    Интерполяция методом Ньютона с использованием таблицы конечных разностей.
-    xs — массив узлов x
-    ys — массив значений y
-    x  — точка, в которой нужно вычислить P(x)
+    Интерполяционный полином Ньютона на разделённых разностях:
+        P(x) = c0 + c1(x − x0) + c2(x − x0)(x − x1) + ...,
+        c_k = f[x0, ..., x_k].
+    Узлы могут идти с любым шагом и в любом порядке.
+
+    Хранится не вся таблица разностей, а две её «диагонали» по O(n):
+        coeffs — верхняя диагональ c_k = f[x0, ..., x_k];
+        tail   — нижняя: tail[k] = f[x_{n−k}, ..., x_n] для последнего узла x_n.
+    По tail новый узел добавляется за O(n) без пересчёта таблицы, в том
+    числе у полинома, загруженного через Interpolant.load.
     """
-    import math
 
-    n = len(xs)
+    __slots__ = ("xs", "coeffs", "tail")
+
+    def __init__(self, xs=(), ys=()):
+        xs = np.array(xs, dtype=np.float64)
+        c = np.array(ys, dtype=np.float64)
+        if xs.shape != c.shape or xs.ndim != 1:
+            raise ValueError("xs и ys должны быть одномерными и одной длины.")
+        if len(np.unique(xs)) != len(xs):
+            raise ValueError("Узлы интерполяции должны быть различными.")
+
+        # таблица разностей на месте: после шага j в c[j:] стоят разности
+        # порядка j, а c[-1] = f[x_{n−1−j}, ..., x_{n−1}] — очередной элемент tail
+        n = len(xs)
+        tail = np.empty(n)
+        if n:
+            tail[0] = c[-1]
+        for j in range(1, n):
+            c[j:] = (c[j:] - c[j - 1:-1]) / (xs[j:] - xs[:n - j])
+            tail[j] = c[-1]
 
-    # Таблица конечных разностей
-    diff = [[0 for _ in range(n)] for _ in range(n)]
-    for i in range(n):
-        diff[i][0] = ys[i]
+        self.xs = xs
+        self.coeffs = c
+        self.tail = tail
 
-    # Вычисляем конечные разности всех порядков
-    for j in range(1, n):
-        for i in range(n - j):
-            diff[i][j] = diff[i + 1][j - 1] - diff[i][j - 1]
+    def __len__(self):
+        return len(self.xs)
 
-    # Шаг таблицы
-    h = xs[1] - xs[0]
-    t = (x - xs[0]) / h
+    def add_node(self, x, y):
+        """Добавляет узел (x, y) за O(n)."""
+        x, y = float(x), float(y)
+        if np.any(self.xs == x):
+            raise ValueError(f"Узел x = {x} уже есть в таблице.")
 
-    # Вычисляем значение полинома
-    result = diff[0][0]
-    t_prod = 1
+        n = len(self.xs)
+        xs, old = self.xs.tolist(), self.tail.tolist()
+        tail = [y]
+        # f[x_{n−k}, ..., x_n, x] = (f[x_{n−k+1}, ..., x] − f[x_{n−k}, ..., x_n]) / (x − x_{n−k})
+        for k in range(n):
+            tail.append((tail[k] - old[k]) / (x - xs[n - 1 - k]))
 
-    for j in range(1, n):
-        t_prod *= (t - (j - 1))
-        result += t_prod * diff[0][j] / math.factorial(j)
+        self.xs = np.append(self.xs, x)
+        self.tail = np.array(tail)
+        self.coeffs = np.append(self.coeffs, tail[-1])
 
-    return result
+    def __call__(self, x):
+        """P(x) вложенным умножением; x — число или массив."""
+        if not len(self.xs):
+            raise ValueError("Нет узлов интерполяции.")
+        x = np.asarray(x, dtype=float)
+
+        result = np.full(x.shape, self.coeffs[-1])
+        for k in range(len(self.xs) - 2, -1, -1):
+            result = self.coeffs[k] + (x - self.xs[k]) * result
+
+        return float(result) if result.ndim == 0 else result
+
+
+def newton_interpolation(x, xs, ys):
+    """
+    Интерполяция методом Ньютона (разделённые разности).
+    xs — массив узлов x (шаг может быть неравномерным)
+    ys — массив значений y
+    x  — точка или массив точек, в которых нужно вычислить P(x)
+    """
+    return NewtonInterpolant(xs, ys)(x)
@@ -0,0 +1,86 @@
+"""
+Барицентрическая рациональная интерполяция Флоатера–Хормана.
+
+На равноотстоящих узлах полином высокой степени расходится (эффект
+Рунге), а перейти к узлам Чебышёва для табличных данных нельзя.
+Интерполянт Флоатера–Хормана — смесь локальных полиномов степени d
+по d + 1 соседним узлам; он проходит через все узлы, не имеет полюсов
+на вещественной оси и сходится как h^{d+1}.
+
+Записывается он той же барицентрической формулой, что и полином
+Лагранжа (lagrange.barycentric), меняются только веса:
+    w_k = (−1)^{k−d} Σ_{i ∈ J_k} Π_{j=i..i+d, j≠k} 1 / |x_k − x_j|,
+    J_k = {i : k − d ≤ i ≤ k, 0 ≤ i ≤ n − d}.
+Для равноотстоящих узлов произведение сводится к биномиальному
+коэффициенту: w_k = (−1)^{k−d} Σ_{i ∈ J_k} C(d, k − i) — это O(nd).
+"""
+
+import math
+
+import numpy as np
+
+from interpolants import Interpolant
+from lagrange import barycentric
+
+
+def floater_hormann_weights(xs, d: int = 3, equispaced=None) -> np.ndarray:
+    """
+    Веса Флоатера–Хормана для возрастающих узлов xs.
+
+    :param d: степень смешиваемых локальных полиномов, 0 ≤ d ≤ n
+    :param equispaced: True — формула для равного шага, O(nd);
+                       False — общая формула, O(nd²);
+                       None — определить по узлам
+    """
+    xs = np.asarray(xs, dtype=float)
+    n = len(xs) - 1
+    if not 0 <= d <= n:
+        raise ValueError(f"Степень смешивания d должна быть от 0 до {n}.")
+
+    k = np.arange(n + 1)
+    sign = np.where((k - d) % 2 == 0, 1.0, -1.0)
+    w = np.zeros(n + 1)
+
+    if equispaced is None:
+        h = np.diff(xs)
+        equispaced = bool(np.allclose(h, h[0], rtol=1e-10, atol=0.0))
+
+    if equispaced:
+        # узел k входит в окна i = k − s, s = 0..d, пока 0 ≤ i ≤ n − d
+        for s in range(d + 1):
+            w[s:n - d + 1 + s] += math.comb(d, s)
+        return sign * w
+
+    # окна i = 0..n − d: (n − d + 1, d + 1) узлов, попарные разности внутри окна
+    win = xs[np.arange(n - d + 1)[:, None] + np.arange(d + 1)]
+    diff = np.abs(win[:, :, None] - win[:, None, :])
+    diff[:, np.arange(d + 1), np.arange(d + 1)] = 1.0
+    inv = 1.0 / np.prod(diff, axis=2)           # вклад окна i в вес узла i + a
+    for a in range(d + 1):
+        w[a:n - d + 1 + a] += inv[:, a]
+    return sign * w
+
+
+class FloaterHormann(Interpolant):
+    """
+    Рациональный интерполянт Флоатера–Хормана с параметром смешивания d.
+    Веса считаются один раз, значение в точке — O(n) (векторно).
+    """
+
+    __slots__ = ("xs", "ys", "w")
+
+    def __init__(self, xs, ys, d=3):
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if xs.shape != ys.shape or xs.ndim != 1:
+            raise ValueError("xs и ys должны быть одномерными и одной длины.")
+
+        order = np.argsort(xs, kind="stable")
+        self.xs = np.ascontiguousarray(xs[order])
+        self.ys = np.ascontiguousarray(ys[order])
+        if np.any(np.diff(self.xs) == 0):
+            raise ValueError("Узлы интерполяции должны быть различными.")
+        self.w = floater_hormann_weights(self.xs, d)
+
+    def __call__(self, x):
+        return barycentric(x, self.xs, self.ys, self.w)
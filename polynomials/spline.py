@@ -0,0 +1,142 @@
+"""
+Интерполяционный кубический сплайн.
+
+Для больших таблиц (10⁴–10⁶ узлов) один глобальный полином не годится:
+степень огромна, а колебания между узлами неизбежны. Сплайн на каждом
+отрезке [x_i, x_{i+1}] — свой кубический многочлен, а стыкуются они
+непрерывными первой и второй производными.
+
+Неизвестные — моменты M_i = S''(x_i). Во внутренних узлах
+    h_{i−1} M_{i−1} + 2(h_{i−1} + h_i) M_i + h_i M_{i+1} = 6 (d_i − d_{i−1}),
+    d_i = (y_{i+1} − y_i) / h_i,
+а два недостающих уравнения дают краевые условия:
+    "natural"    — M_0 = M_n = 0;
+    "clamped"    — заданы S'(x_0) и S'(x_n);
+    "not-a-knot" — S''' непрерывна в x_1 и x_{n−1}.
+Система трёхдиагональная и решается прогонкой (forward.py, backward.py)
+за O(n).
+"""
+
+import numpy as np
+
+from forward import forward_pass
+from backward import backward_pass
+from interpolants import Interpolant
+
+
+def _moments(x, y, bc, slopes):
+    n = len(x) - 1
+    h = np.diff(x)
+    d = np.diff(y) / h
+
+    if n == 1:
+        # через две точки — прямая (для clamped — единственная кубика)
+        if bc != "clamped":
+            return np.zeros(2)
+    elif n == 2 and bc == "not-a-knot":
+        # одна внутренняя точка: сплайн совпадает с параболой через три узла
+        return np.full(3, 2 * (d[1] - d[0]) / (h[0] + h[1]))
+
+    # внутренние уравнения i = 1..n−1
+    a = h[:-1].copy()
+    b = 2 * (h[:-1] + h[1:])
+    c = h[1:].copy()
+    f = 6 * np.diff(d)
+
+    if bc == "natural":
+        M = np.zeros(n + 1)
+        M[1:n] = _solve(a, b, c, f)
+        return M
+
+    if bc == "clamped":
+        s0, sn = slopes
+        a = np.concatenate([[0.0], a, [h[-1]]])
+        b = np.concatenate([[2 * h[0]], b, [2 * h[-1]]])
+        c = np.concatenate([[h[0]], c, [0.0]])
+        f = np.concatenate([[6 * (d[0] - s0)], f, [6 * (sn - d[-1])]])
+        return _solve(a, b, c, f)
+
+    if bc == "not-a-knot":
+        # M_0 и M_n выражаются через соседей и исключаются из системы
+        h0, h1 = h[0], h[1]
+        b[0] = (h0 + h1) * (h0 + 2 * h1) / h1
+        c[0] = (h1 - h0) * (h1 + h0) / h1
+        g0, g1 = h[-1], h[-2]
+        a[-1] = (g1 - g0) * (g1 + g0) / g1
+        b[-1] = (g1 + g0) * (2 * g1 + g0) / g1
+
+        M = np.empty(n + 1)
+        M[1:n] = _solve(a, b, c, f)
+        M[0] = ((h0 + h1) * M[1] - h0 * M[2]) / h1
+        M[n] = ((g0 + g1) * M[n - 1] - g0 * M[n - 2]) / g1
+        return M
+
+    raise ValueError(f"Неизвестное краевое условие: {bc}")
+
+
+def _solve(a, b, c, f):
+    # прогонка быстрее на списках Python, чем поэлементно по массивам numpy
+    cp, fp = forward_pass(a.tolist(), b.tolist(), c.tolist(), f.tolist())
+    return np.array(backward_pass(cp, fp))
+
+
+class CubicSpline(Interpolant):
+    """
+    Кубический сплайн S(x) по таблице (xs, ys).
+    Состояние — узлы x, значения y и коэффициенты b, c, e кубик на отрезках
+    (сохраняется и загружается как любой Interpolant).
+
+    :param bc: "natural", "clamped" или "not-a-knot"
+    :param slopes: (S'(x_0), S'(x_n)) для bc="clamped"
+    """
+
+    __slots__ = ("x", "y", "b", "c", "e")
+
+    def __init__(self, xs, ys, bc="natural", slopes=(0.0, 0.0)):
+        x = np.asarray(xs, dtype=float)
+        y = np.asarray(ys, dtype=float)
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError("xs и ys должны быть одномерными и одной длины.")
+        if len(x) < 2:
+            raise ValueError("Нужно минимум две точки для сплайна.")
+
+        order = np.argsort(x, kind="stable")
+        x, y = x[order], y[order]
+        if np.any(np.diff(x) == 0):
+            raise ValueError("Узлы сплайна должны быть различными.")
+
+        M = _moments(x, y, bc, slopes)
+        h = np.diff(x)
+
+        # S(x) = y_i + t(b_i + t(c_i + t e_i)),  t = x − x_i
+        self.x = x
+        self.y = y
+        self.b = np.diff(y) / h - h * (2 * M[:-1] + M[1:]) / 6
+        self.c = M[:-1] / 2
+        self.e = np.diff(M) / (6 * h)
+
+    def _locate(self, x):
+        i = np.searchsorted(self.x, x, side="right") - 1
+        i = np.clip(i, 0, len(self.x) - 2)      # вне таблицы — крайние кубики
+        return i, x - self.x[i]
+
+    def __call__(self, x):
+        """S(x) для числа или массива точек."""
+        x = np.asarray(x, dtype=float)
+        i, t = self._locate(x)
+        result = self.y[i] + t * (self.b[i] + t * (self.c[i] + t * self.e[i]))
+        return float(result) if result.ndim == 0 else result
+
+    def derivative(self, x, order=1):
+        """S'(x), S''(x) или S'''(x) для числа или массива точек."""
+        x = np.asarray(x, dtype=float)
+        i, t = self._locate(x)
+        if order == 1:
+            result = self.b[i] + t * (2 * self.c[i] + 3 * t * self.e[i])
+        elif order == 2:
+            result = 2 * self.c[i] + 6 * t * self.e[i]
+        elif order == 3:
+            result = 6 * self.e[i]
+        else:
+            raise ValueError("Порядок производной должен быть 1, 2 или 3.")
+        return float(result) if result.ndim == 0 else result
@@ -0,0 +1,43 @@
+"""Проверки save / load: загруженный интерполянт совпадает с исходным."""
+
+import numpy as np
+import pytest
+
+from interpolants import BarycentricInterpolant, CanonicalPolynomial, Interpolant
+from local import LocalInterpolant
+from newton import NewtonInterpolant
+from spline import CubicSpline
+
+XS = np.linspace(-1.0, 1.0, 9)
+YS = np.cos(3 * XS)
+T = np.linspace(-1.0, 1.0, 101)
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+@pytest.mark.parametrize("make", [
+    BarycentricInterpolant, NewtonInterpolant, CanonicalPolynomial,
+    CubicSpline, lambda xs, ys: LocalInterpolant(xs, ys, k=4),
+])
+def test_save_load_round_trip(tmp_path, make, mmap):
+    p = make(XS, YS)
+    path = tmp_path / "p.npz"
+    p.save(path)
+
+    q = Interpolant.load(path, mmap=mmap)
+    assert type(q) is type(p)
+    assert np.array_equal(q(T), p(T))
+
+
+def test_loaded_newton_keeps_node_insertion(tmp_path):
+    path = tmp_path / "newton.npz"
+    NewtonInterpolant(XS[:-1], YS[:-1]).save(path)
+
+    q = Interpolant.load(path, mmap=True)
+    q.add_node(XS[-1], YS[-1])
+    assert np.allclose(q(T), NewtonInterpolant(XS, YS)(T), rtol=0, atol=1e-12)
+
+
+def test_local_window_size_is_int(tmp_path):
+    path = tmp_path / "local.npz"
+    LocalInterpolant(XS, YS, k=3).save(path)
+    assert Interpolant.load(path).k == 3
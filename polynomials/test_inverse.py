@@ -0,0 +1,26 @@
+"""Проверки обратной интерполяции: S(inverse(y)) должно совпадать с y."""
+
+import numpy as np
+
+from inverse import InverseSpline
+
+
+def test_inverse_monotone_table():
+    xs = np.linspace(0.0, 1.0, 50)
+    s = InverseSpline(xs, np.exp(xs))
+    y = np.random.default_rng(0).uniform(1.0, np.e, 100000)
+
+    x = s.inverse(y)
+    assert np.max(np.abs(s(x) - y)) < 1e-12
+    assert abs(s(s.inverse(2.6372)) - 2.6372) < 1e-12
+
+
+def test_roots_on_every_monotone_segment():
+    xs = np.linspace(0.0, 10.0, 201)
+    s = InverseSpline(xs, np.sin(xs))
+    y = np.random.default_rng(1).uniform(-0.99, 0.99, 20000)
+
+    r = s.roots(y)
+    found = ~np.isnan(r)
+    assert found.any(axis=1).all()
+    assert np.max(np.abs(s(r[found]) - np.broadcast_to(y[:, None], r.shape)[found])) < 1e-12
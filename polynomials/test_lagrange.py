@@ -0,0 +1,36 @@
+"""Проверки барицентрических весов и интерполяции Лагранжа."""
+
+import numpy as np
+
+from lagrange import barycentric, barycentric_weights
+
+
+def _normalized(w):
+    return w / w[0]
+
+
+def test_general_weights_match_closed_forms():
+    for xs, nodes in [(np.linspace(-1.0, 1.0, 31), "equispaced"),
+                      (-np.cos(np.arange(41) * np.pi / 40), "chebyshev")]:
+        general = barycentric_weights(xs, "general")
+        assert np.allclose(_normalized(general), _normalized(barycentric_weights(xs, nodes)),
+                           rtol=1e-12, atol=0)
+
+
+def test_general_weights_do_not_depend_on_chunk():
+    xs = np.random.default_rng(0).permutation(np.linspace(0.0, 3.0, 200))
+    assert np.array_equal(barycentric_weights(xs, "general"),
+                          barycentric_weights(xs, "general", chunk=37))
+
+
+def test_large_n_weights_are_finite():
+    xs = np.sort(np.random.default_rng(1).uniform(-1.0, 1.0, 3000))
+    assert np.all(np.isfinite(barycentric_weights(xs, "general")))
+    assert np.all(np.isfinite(barycentric_weights(np.linspace(-1.0, 1.0, 3000))))
+
+
+def test_reproduces_polynomial():
+    xs = np.sort(np.random.default_rng(2).uniform(-2.0, 2.0, 8))
+    p = np.polynomial.Polynomial([1.0, -2.0, 0.5, 3.0, 0.0, -1.0, 0.25])
+    t = np.linspace(-2.0, 2.0, 57)
+    assert np.allclose(barycentric(t, xs, p(xs)), p(t), rtol=0, atol=1e-10)
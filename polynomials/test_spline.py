@@ -0,0 +1,31 @@
+"""Проверки кубического сплайна на многочленах, которые он обязан воспроизводить."""
+
+import numpy as np
+
+from spline import CubicSpline
+
+CUBIC = np.polynomial.Polynomial([0.5, -1.0, 2.0, 0.75])
+XS = np.array([-2.0, -1.3, -0.4, 0.0, 0.9, 1.5, 3.0])
+T = np.linspace(-2.0, 3.0, 201)
+
+
+def test_not_a_knot_reproduces_cubic():
+    s = CubicSpline(XS, CUBIC(XS), bc="not-a-knot")
+    assert np.allclose(s(T), CUBIC(T), rtol=0, atol=1e-11)
+    for order in (1, 2, 3):
+        assert np.allclose(s.derivative(T, order), CUBIC.deriv(order)(T), rtol=0, atol=1e-9)
+
+
+def test_clamped_reproduces_cubic():
+    d = CUBIC.deriv()
+    s = CubicSpline(XS, CUBIC(XS), bc="clamped", slopes=(d(XS[0]), d(XS[-1])))
+    assert np.allclose(s(T), CUBIC(T), rtol=0, atol=1e-11)
+
+
+def test_natural_reproduces_line_and_has_zero_end_moments():
+    s = CubicSpline(XS, 3.0 * XS - 1.0)
+    assert np.allclose(s(T), 3.0 * T - 1.0, rtol=0, atol=1e-12)
+
+    s = CubicSpline(XS, CUBIC(XS))
+    assert np.allclose(s.derivative(XS[[0, -1]], 2), 0.0, atol=1e-12)
+    assert np.allclose(s(XS), CUBIC(XS), rtol=0, atol=1e-12)
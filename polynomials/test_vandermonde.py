@@ -0,0 +1,43 @@
+"""Проверки алгоритма Бьорка–Перейры против np.linalg.solve."""
+
+import numpy as np
+import pytest
+
+from vandermonde import bjorck_pereyra, vandermonde_coeffs
+
+
+def test_matches_linalg_solve():
+    rng = np.random.default_rng(0)
+    xs = np.sort(rng.uniform(-1.0, 1.0, 12))
+    ys = rng.normal(size=12)
+
+    ref = np.linalg.solve(np.vander(xs, increasing=True), ys)
+    assert np.allclose(bjorck_pereyra(xs, ys), ref, rtol=1e-8, atol=1e-8)
+
+
+def test_several_right_hand_sides():
+    xs = np.linspace(0.0, 2.0, 8)
+    Y = np.random.default_rng(1).normal(size=(8, 3))
+
+    ref = np.linalg.solve(np.vander(xs, increasing=True), Y)
+    assert np.allclose(bjorck_pereyra(xs, Y), ref, rtol=1e-9, atol=1e-9)
+
+
+def test_reproduces_polynomial_exactly():
+    xs = np.array([-1.0, -0.5, 0.0, 0.5, 1.0, 1.5])
+    coeffs = np.array([1.0, -2.0, 0.5, 3.0, 0.0, -1.0])
+    ys = np.polynomial.polynomial.polyval(xs, coeffs)
+    assert np.allclose(bjorck_pereyra(xs, ys), coeffs, rtol=0, atol=1e-12)
+
+
+def test_repeated_nodes_rejected():
+    with pytest.raises(ValueError):
+        bjorck_pereyra([0.0, 1.0, 1.0], [1.0, 2.0, 3.0])
+
+
+def test_cache_returns_read_only_coefficients():
+    xs, ys = [0.0, 1.0, 2.0], [1.0, 3.0, 7.0]
+    c = vandermonde_coeffs(xs, ys)
+    assert c is vandermonde_coeffs(xs, ys)
+    assert not c.flags.writeable
+    assert np.allclose(c, [1.0, 1.0, 1.0])
@@ -0,0 +1,65 @@
+"""
+Коэффициенты канонического полинома без обращения матрицы Вандермонда.
+
+Система V a = y с V_ij = x_i^j решается алгоритмом Бьорка–Перейры:
+сначала считаются разделённые разности (форма Ньютона), затем они
+переводятся в мономиальный базис. Это O(n²) операций и O(n) памяти
+вместо O(n³) у np.linalg.solve / np.linalg.inv, и обычно точнее:
+плохая обусловленность V почти не сказывается на результате.
+
+Коэффициенты одной и той же таблицы (xs, ys) кэшируются, поэтому
+вычисление P(x) во многих точках не решает систему повторно.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+def bjorck_pereyra(xs, ys) -> np.ndarray:
+    """
+    Решение V a = y, V = np.vander(xs, increasing=True), за O(n²).
+
+    :param xs: узлы (попарно различные)
+    :param ys: значения; двумерный массив (n, k) — k правых частей сразу
+    :return: коэффициенты a по возрастанию степеней (той же формы, что ys)
+    """
+    x = np.asarray(xs, dtype=float)
+    a = np.array(ys, dtype=float)
+    n = len(x) - 1
+    if a.shape[0] != n + 1:
+        raise ValueError("xs и ys должны иметь одинаковую длину")
+    if len(np.unique(x)) != n + 1:
+        raise ValueError("Узлы интерполяции должны быть различными.")
+
+    # с двумерной правой частью узлы делятся построчно
+    xc = x.reshape((-1,) + (1,) * (a.ndim - 1))
+
+    # 1) разделённые разности: a_i ← f[x_0, ..., x_i]
+    for k in range(n):
+        a[k + 1:] = (a[k + 1:] - a[k:n]) / (xc[k + 1:] - xc[:n - k])
+
+    # 2) форма Ньютона → мономы: раскрываем (x − x_k) справа налево
+    for k in range(n - 1, -1, -1):
+        a[k:n] -= x[k] * a[k + 1:]
+
+    return a
+
+
+@lru_cache(maxsize=64)
+def _cached(xs_key: bytes, ys_key: bytes) -> np.ndarray:
+    coeffs = bjorck_pereyra(np.frombuffer(xs_key), np.frombuffer(ys_key))
+    coeffs.flags.writeable = False      # один массив отдаётся многим вызывающим
+    return coeffs
+
+
+def vandermonde_coeffs(xs, ys) -> np.ndarray:
+    """
+    Коэффициенты интерполяционного полинома по возрастанию степеней.
+    Для уже встречавшейся таблицы (xs, ys) берутся из кэша.
+    """
+    xs = np.ascontiguousarray(xs, dtype=float)
+    ys = np.ascontiguousarray(ys, dtype=float)
+    if xs.shape != ys.shape:
+        raise ValueError("xs и ys должны иметь одинаковую длину")
+    return _cached(xs.tobytes(), ys.tobytes())